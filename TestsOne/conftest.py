@@ -8,6 +8,8 @@ Test Structure:
 └── e2e/            - End-to-end tests with real DB (optional)
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 
 
@@ -114,3 +116,30 @@ def dummy_db():
     """Provide a mock database session."""
     return DummyDB()
 
+
+@pytest.fixture
+def db():
+    """Provide a fresh mock DB session (per test, since calls are asserted).
+
+    Built anew rather than copied from a template: copies of a MagicMock
+    share its child mocks, so call history would leak between tests.
+    """
+    return MagicMock()
+
+
+@pytest.fixture(scope="session")
+def make_chain_db():
+    """Return a factory for mock sessions whose query chain ends in first().
+
+    ``filter()`` returns the query mock itself, so the same db works for
+    lookups that chain any number of filters before ``.first()``.
+    """
+    def _make(first_return=None):
+        query = MagicMock()
+        query.filter.return_value = query
+        query.first.return_value = first_return
+        db = MagicMock()
+        db.query.return_value = query
+        return db
+
+    return _make
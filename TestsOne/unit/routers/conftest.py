@@ -0,0 +1,30 @@
+# tests/unit/routers/conftest.py
+"""
+Fixtures shared by the router unit tests.
+
+Router functions are called directly, so the requests they normally
+receive are built here; the mock DB session comes from the top-level
+``db`` fixture.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import Request
+
+
+@pytest.fixture
+def make_request():
+    """Return a factory for spec'd async requests whose json() yields payload.
+
+    Pass ``raises`` to make ``await request.json()`` raise instead.
+    """
+    def _make(payload=None, raises=None):
+        request = AsyncMock(spec=Request)
+        if raises is not None:
+            request.json.side_effect = raises
+        else:
+            request.json.return_value = {} if payload is None else payload
+        return request
+
+    return _make
@@ -1,12 +1,15 @@
 import io
 import pytest
 import pandas as pd
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock, patch, AsyncMock, ANY
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.exc import IntegrityError
 
 from app.dcim.routers import bulk_upload_router
 from app.helpers.listing_types import ListingType
+from app.dcim.routers.bulk_upload_router import BulkUploadEntityType, check_row_uniqueness_for_bulk
+from app.models.entity_models import Wing, Floor, Datacenter, ApplicationMapped, Rack, Model
+
 
 class TestBulkUploadRouter:
     """Unit tests for bulk_upload_router module."""
@@ -202,12 +205,6 @@ class TestBulkUploadEndpoint:
 # Migrated Coverage Tests (Helpers & Process Logic)
 # =============================================================================
 
-import pandas as pd
-from unittest.mock import MagicMock, patch, ANY
-from app.dcim.routers import bulk_upload_router
-from app.dcim.routers.bulk_upload_router import BulkUploadEntityType
-from app.helpers.listing_types import ListingType
-
 def test_load_dataframe_simple():
     csv_bytes = b"name,status\nd1,active"
     df = bulk_upload_router._load_dataframe_from_bytes(csv_bytes)
@@ -362,11 +359,6 @@ def test_process_bulk_upload_job_error():
          mock_report.assert_called_once()
          call_kwargs = mock_report.call_args[1]
          assert call_kwargs["failure_reason"] == "CSV Error"
-import pytest
-import pandas as pd
-from unittest.mock import MagicMock, patch, ANY
-from app.dcim.routers import bulk_upload_router
-from app.helpers.listing_types import ListingType
 
 # =============================================================================
 # Helper Function Tests (_extract_entity_data_from_row)
@@ -639,11 +631,7 @@ class TestProcessMultiEntityRows:
              assert summary["aborted"] is True
              assert summary["errors"][ListingType.wings.value] == 1
              assert db.rollback.called
-import pytest
-from unittest.mock import MagicMock, patch
-from fastapi import HTTPException
-from app.dcim.routers.bulk_upload_router import check_row_uniqueness_for_bulk
-from app.models.entity_models import Wing, Floor, Datacenter, ApplicationMapped, Rack, Model
+
 
 class TestBulkUploadUniqueness:
     """Tests for check_row_uniqueness_for_bulk."""
@@ -1,4 +1,5 @@
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from app.dcim.routers import hierarchy_router
 
@@ -9,42 +10,14 @@ class TestHierarchyRouter:
         """Positive: Returns nested hierarchy structure."""
         db = MagicMock()
         
-        # Mock nested objects
-        loc = MagicMock()
-        loc.id = 1
-        loc.name = "Loc1"
-        
-        bldg = MagicMock()
-        bldg.id = 2
-        bldg.name = "Bldg1"
-        
-        wing = MagicMock()
-        wing.id = 3
-        wing.name = "Wing1"
-        
-        floor = MagicMock()
-        floor.id = 4
-        floor.name = "Floor1"
-        
-        dc = MagicMock()
-        dc.id = 5
-        dc.name = "DC1"
-        
-        rack = MagicMock()
-        rack.id = 6
-        rack.name = "Rack1"
-        
-        device = MagicMock()
-        device.id = 7
-        device.name = "Dev1"
-        
-        # Link them
-        rack.devices = [device]
-        dc.racks = [rack]
-        floor.datacenters = [dc]
-        wing.floors = [floor]
-        bldg.wings = [wing]
-        loc.buildings = [bldg]
+        # Build nested objects, innermost first
+        device = SimpleNamespace(id=7, name="Dev1")
+        rack = SimpleNamespace(id=6, name="Rack1", devices=[device])
+        dc = SimpleNamespace(id=5, name="DC1", racks=[rack])
+        floor = SimpleNamespace(id=4, name="Floor1", datacenters=[dc])
+        wing = SimpleNamespace(id=3, name="Wing1", floors=[floor])
+        bldg = SimpleNamespace(id=2, name="Bldg1", wings=[wing])
+        loc = SimpleNamespace(id=1, name="Loc1", buildings=[bldg])
         
         # Mock DB execute
         db.execute.return_value.scalars.return_value.all.return_value = [loc]
@@ -1,8 +1,10 @@
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from fastapi import HTTPException
 from app.dcim.routers import login_router
 from app.schemas import auth_schemas as schemas
+from app.models import auth_models as models
 
 class TestLoginRouter:
     """Unit tests for login_router module."""
@@ -12,13 +14,15 @@ class TestLoginRouter:
         credentials = schemas.LoginRequest(username="admin", password="password")
         db = MagicMock()
         
-        user_mock = MagicMock()
-        user_mock.id = 1
-        user_mock.name = "admin"
-        user_mock.is_active = True
-        user_mock.email = "admin@example.com"
-        user_mock.full_name = "Admin User"
-        user_mock.description = "System Admin"
+        user_mock = SimpleNamespace(
+            id=1,
+            name="admin",
+            is_active=True,
+            email="admin@example.com",
+            full_name="Admin User",
+            description="System Admin",
+            last_login=None,
+        )
         
         # Mock user lookup
         db.query.return_value.filter.return_value.first.return_value = user_mock
@@ -28,7 +32,7 @@ class TestLoginRouter:
              patch("app.dcim.routers.login_router.build_menu_for_user") as mock_build_menu, \
              patch("app.dcim.routers.login_router._build_configure_flags") as mock_flags:
             
-            mock_create_tokens.return_value = ("access_token", MagicMock(token_key="refresh_token"))
+            mock_create_tokens.return_value = ("access_token", SimpleNamespace(token_key="refresh_token"))
             mock_build_menu.return_value = {"menuList": []}
             mock_flags.return_value = schemas.ConfigureFlags(is_editable=True, is_deletable=True, is_viewer=True)
             
@@ -82,12 +86,6 @@ class TestLoginRouter:
             # verify delete called on token query
             db.query.return_value.filter.return_value.delete.assert_called_once()
             db.commit.assert_called_once()
-import pytest
-from unittest.mock import MagicMock, patch
-from fastapi import HTTPException
-from app.dcim.routers import login_router
-from app.schemas import auth_schemas as schemas
-from app.models import auth_models as models
 
 # ============================================================
 # Extended Tests for Login Router
@@ -131,16 +129,18 @@ class TestRefreshToken:
         """Positive: Refresh token flow."""
         db = MagicMock()
         
-        user_mock = MagicMock(spec=models.User, id=1, is_active=True)
-        user_mock.name = "admin"
-        user_mock.email = "admin@example.com"
-        user_mock.full_name = "Admin User"
-        user_mock.description = "Admin"
-        user_mock.created_at = "2023-01-01" # datetime or string depending on schema, schema usually allows str for datetime
-        # Actually UserRead schema expects datetime usually, but let's see. 
-        # Better to assume Pydantic handles MagicMock if spec is right? No, value must be right type.
+        user_mock = SimpleNamespace(
+            id=1,
+            is_active=True,
+            name="admin",
+            email="admin@example.com",
+            full_name="Admin User",
+            description="Admin",
+            created_at="2023-01-01",
+            last_login=None,
+        )
         
-        refresh_token_model = MagicMock(user=user_mock, token_key="old_refresh")
+        refresh_token_model = SimpleNamespace(user=user_mock, token_key="old_refresh")
         
         configure_flags = schemas.ConfigureFlags(is_editable=True, is_deletable=False, is_viewer=True)
         
@@ -1,18 +1,54 @@
 import pytest
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch, ANY
 from fastapi import HTTPException
 from app.dcim.routers import overview_router
 from app.dcim.routers.overview_router import EntityType
 
+
+@dataclass(slots=True)
+class _FakeResult:
+    """Stand-in for the Result returned by db.execute()."""
+    value: object
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class _FakeDB:
+    """DB session whose execute() always yields the given entity (or None)."""
+    def __init__(self, value):
+        self._value = value
+
+    def execute(self, *args, **kwargs):
+        return _FakeResult(self._value)
+
+
+@pytest.fixture(scope="module")
+def current_user():
+    """Provide a current user stand-in shared across this module."""
+    return MagicMock()
+
+
+def _get_overview(db, current_user, entity_name, entity_type):
+    """Call the endpoint directly with no hierarchy filters and admin access."""
+    # Explicitly pass None so the Query(...) defaults are not used as values
+    return overview_router.get_entity_overview(
+        entity_name=entity_name,
+        entity_type=entity_type,
+        location=None, building=None, wing=None, floor=None, datacenter=None,
+        db=db,
+        current_user=current_user,
+        access_level=5
+    )
+
+
 class TestOverviewRouter:
     """Unit tests for overview_router module."""
 
     @patch("app.dcim.routers.overview_router.get_db")
-    def test_get_entity_overview_location_success(self, mock_get_db):
+    def test_get_entity_overview_location_success(self, mock_get_db, current_user):
         """Positive: Retrieve location overview successfully."""
-        mock_db = MagicMock()
-        mock_get_db.return_value = mock_db
-        
         # Mock entity
         mock_loc = MagicMock()
         mock_loc.id = 1
@@ -25,30 +61,19 @@ class TestOverviewRouter:
         mock_loc.racks = []
         mock_loc.devices = []
         
-        # Mock DB execute result
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_loc
-        mock_db.execute.return_value = mock_result
+        mock_db = _FakeDB(mock_loc)
+        mock_get_db.return_value = mock_db
         
         # Call endpoint
-        response = overview_router.get_entity_overview(
-            entity_name="Test Loc",
-            entity_type=EntityType.location,
-            location=None, building=None, wing=None, floor=None, datacenter=None, # Explicitly pass None
-            db=mock_db,
-            current_user=MagicMock(),
-            access_level=5
-        )
+        response = _get_overview(mock_db, current_user, "Test Loc", EntityType.location)
         
         assert response["name"] == "Test Loc"
         assert response["type"] == "Location"
         assert response["counts"]["buildings"] == 1
         assert "device_stats" in response
 
-    def test_get_entity_overview_rack_success(self):
+    def test_get_entity_overview_rack_success(self, current_user):
         """Positive: Retrieve rack overview (special handling)."""
-        mock_db = MagicMock()
-        
         mock_rack = MagicMock()
         mock_rack.id = 10
         mock_rack.name = "Rack 1"
@@ -60,43 +85,24 @@ class TestOverviewRouter:
         dev1.device_type.name = "Server"
         mock_rack.devices = [dev1]
         
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = mock_rack
-        mock_db.execute.return_value = mock_result
-        
-        response = overview_router.get_entity_overview(
-            entity_name="Rack 1",
-            entity_type=EntityType.rack,
-            location=None, building=None, wing=None, floor=None, datacenter=None, # Explicitly pass None
-            db=mock_db,
-            current_user=MagicMock(),
-            access_level=5
-        )
+        mock_db = _FakeDB(mock_rack)
+        
+        response = _get_overview(mock_db, current_user, "Rack 1", EntityType.rack)
         
         assert response["type"] == "Rack"
         assert response["device_stats"]["total_devices"] == 1
         assert response["device_stats"]["active_devices"] == 1
         assert response["space_stats"]["used_space"] == 2
         
-    def test_get_entity_overview_not_found(self):
+    def test_get_entity_overview_not_found(self, current_user):
         """Negative: Entity not found raises 404."""
-        mock_db = MagicMock()
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db = _FakeDB(None)
         
         with pytest.raises(HTTPException) as exc:
-            overview_router.get_entity_overview(
-                entity_name="Missing",
-                entity_type=EntityType.location,
-                location=None, building=None, wing=None, floor=None, datacenter=None, # Explicitly pass None
-                db=mock_db,
-                current_user=MagicMock(),
-                access_level=5
-            )
+            _get_overview(mock_db, current_user, "Missing", EntityType.location)
         assert exc.value.status_code == 404
 
-    def test_get_entity_overview_multiple_found(self):
+    def test_get_entity_overview_multiple_found(self, current_user):
         """Negative: Multiple entities found raises 400."""
         from sqlalchemy.exc import MultipleResultsFound
         
@@ -104,14 +110,7 @@ class TestOverviewRouter:
         mock_db.execute.side_effect = MultipleResultsFound
         
         with pytest.raises(HTTPException) as exc:
-            overview_router.get_entity_overview(
-                entity_name="Duplicate",
-                entity_type=EntityType.building,
-                location=None, building=None, wing=None, floor=None, datacenter=None, # Explicitly pass None
-                db=mock_db,
-                current_user=MagicMock(),
-                access_level=5
-            )
+            _get_overview(mock_db, current_user, "Duplicate", EntityType.building)
         assert exc.value.status_code == 400
         assert "Multiple Building entities" in exc.value.detail
 
@@ -0,0 +1,36 @@
+# tests/unit/search/conftest.py
+"""
+Fixtures shared by the search router unit tests.
+
+The search helpers only ever run db.query(...) followed by a chain of
+join/filter/order_by/limit calls ending in .all(), so a single spec'd
+query chain is built once and reused by every test.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Query, Session
+
+
+@pytest.fixture(scope="session")
+def _query_chain():
+    """Build one Query mock whose chaining methods all return itself."""
+    chain = MagicMock(spec=Query)
+    for method in ("filter", "join", "outerjoin", "order_by", "limit"):
+        getattr(chain, method).return_value = chain
+    return chain
+
+
+@pytest.fixture
+def mock_query_factory(_query_chain):
+    """Return a factory: rows -> (db, query) where db.query(...).all() is rows."""
+    def _make(rows):
+        # reset_mock() clears call counts but keeps the chained return values
+        _query_chain.reset_mock()
+        _query_chain.all.return_value = rows
+        db = MagicMock(spec=Session)
+        db.query.return_value = _query_chain
+        return db, _query_chain
+
+    return _make
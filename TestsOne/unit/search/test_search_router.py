@@ -9,6 +9,8 @@ We focus on:
   - Positive: calls underlying helpers and aggregates counts/total correctly
 """
 
+from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Set
 from unittest.mock import MagicMock, patch
 
@@ -41,22 +43,21 @@ class DummyAccessLevel:
         self.value = value
 
 
-# ============================================================
-# Helper to create a mock query chain
-# ============================================================
+# Row stand-ins returned by the mocked query chain
+@dataclass(frozen=True, slots=True)
+class DummyLoc:
+    id: int
+    name: str
+    description: str
 
 
-def _mock_query_single_model(return_rows: List[Any]):
-    """Create a MagicMock db where db.query(...).all() returns given rows."""
-    db = MagicMock()
-    q = MagicMock()
-    db.query.return_value = q
-    # Chain filters/order/limit to return same mock
-    q.filter.return_value = q
-    q.order_by.return_value = q
-    q.limit.return_value = q
-    q.all.return_value = return_rows
-    return db, q
+@dataclass(frozen=True, slots=True)
+class DummyBldg:
+    id: int
+    name: str
+    status: str
+    description: str
+    address: str
 
 
 # ============================================================
@@ -65,16 +66,10 @@ def _mock_query_single_model(return_rows: List[Any]):
 
 
 class TestSearchLocations:
-    def test_search_locations_returns_mapped_results(self):
+    def test_search_locations_returns_mapped_results(self, mock_query_factory):
         """Positive: returns list of dicts with expected keys."""
-        class DummyLoc:
-            def __init__(self, id, name, description):
-                self.id = id
-                self.name = name
-                self.description = description
-
         loc = DummyLoc(1, "Loc1", "Test location")
-        db, _ = _mock_query_single_model([loc])
+        db, _ = mock_query_factory([loc])
 
         results = _search_locations(db, search_term="loc", limit=5, allowed_location_ids=None)
 
@@ -84,22 +79,6 @@ class TestSearchLocations:
         assert results[0]["description"] == "Test location"
         assert results[0]["type"] == "location"
 
-    def test_search_locations_applies_allowed_location_filter(self):
-        """Edge: when allowed_location_ids provided, IN filter is added."""
-        db = MagicMock()
-        q = MagicMock()
-        db.query.return_value = q
-        q.filter.return_value = q
-        q.order_by.return_value = q
-        q.limit.return_value = q
-        q.all.return_value = []
-
-        allowed_ids = {1, 2}
-        _search_locations(db, search_term="x", limit=5, allowed_location_ids=allowed_ids)
-
-        # Expect final filter to be called with Location.id.in_(allowed_ids)
-        assert q.filter.call_count >= 2  # base conditions + allowed_ids filter
-
 
 # ============================================================
 # Tests for a couple of other helper search functions
@@ -108,26 +87,12 @@ class TestSearchLocations:
 
 
 class TestSearchBuildings:
-    def test_search_buildings_returns_mapped_results(self):
+    def test_search_buildings_returns_mapped_results(self, mock_query_factory):
         """Positive: buildings search maps tuples to dicts."""
-        class DummyBldg:
-            def __init__(self, id, name, status, description, address):
-                self.id = id
-                self.name = name
-                self.status = status
-                self.description = description
-                self.address = address
-
-        class DummyLoc:
-            def __init__(self, name):
-                self.name = name
-
         building = DummyBldg(1, "B1", "ACTIVE", "Test", "Address 1")
-        location = DummyLoc("Loc1")
+        location = SimpleNamespace(name="Loc1")
 
-        db, q = _mock_query_single_model([(building, location)])
-        # Need join() for this helper
-        q.join.return_value = q
+        db, _ = mock_query_factory([(building, location)])
 
         results = _search_buildings(db, search_term="b1", limit=5, allowed_location_ids=None)
 
@@ -137,37 +102,15 @@ class TestSearchBuildings:
         assert results[0]["location"] == "Loc1"
         assert results[0]["type"] == "building"
 
-    def test_search_buildings_applies_allowed_location_filter(self):
-        """Edge: when allowed_location_ids provided, IN filter is added."""
-        db = MagicMock()
-        q = MagicMock()
-        db.query.return_value = q
-        q.join.return_value = q
-        q.filter.return_value = q
-        q.order_by.return_value = q
-        q.limit.return_value = q
-        q.all.return_value = []
-
-        allowed_ids = {1, 2}
-        _search_buildings(db, search_term="x", limit=5, allowed_location_ids=allowed_ids)
-
-        # Expect filters: base OR condition + allowed_ids filter
-        assert q.filter.call_count >= 2
-
 
 class TestSearchRacks:
-    def test_search_racks_returns_mapped_results(self):
+    def test_search_racks_returns_mapped_results(self, mock_query_factory):
         """Positive: racks search maps (Rack, Location, Building) to dict."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
-
-        rack = Dummy(id=1, name="R1", status="ACTIVE", description="d", height=42)
-        loc = Dummy(name="Loc1")
-        bldg = Dummy(name="B1")
+        rack = SimpleNamespace(id=1, name="R1", status="ACTIVE", description="d", height=42)
+        loc = SimpleNamespace(name="Loc1")
+        bldg = SimpleNamespace(name="B1")
 
-        db, q = _mock_query_single_model([(rack, loc, bldg)])
-        q.join.return_value = q
+        db, _ = mock_query_factory([(rack, loc, bldg)])
 
         results = _search_racks(db, search_term="r1", limit=5, allowed_location_ids=None)
 
@@ -180,32 +123,11 @@ class TestSearchRacks:
         assert results[0]["height"] == 42
         assert results[0]["type"] == "rack"
 
-    def test_search_racks_applies_allowed_location_filter(self):
-        """Negative/edge: ensure allowed_location_ids further restricts the query."""
-        db = MagicMock()
-        q = MagicMock()
-        db.query.return_value = q
-        q.join.return_value = q
-        q.filter.return_value = q
-        q.order_by.return_value = q
-        q.limit.return_value = q
-        q.all.return_value = []
-
-        allowed_ids = {1, 2}
-        _search_racks(db, search_term="x", limit=5, allowed_location_ids=allowed_ids)
-
-        # There should be at least one filter call using Rack.location_id.in_(allowed_ids)
-        assert q.filter.call_count >= 2
-
 
 class TestSearchDevices:
-    def test_search_devices_returns_mapped_results(self):
+    def test_search_devices_returns_mapped_results(self, mock_query_factory):
         """Positive: devices search returns dicts with key fields."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
-
-        device = Dummy(
+        device = SimpleNamespace(
             id=1,
             name="Dev1",
             status="ACTIVE",
@@ -216,18 +138,17 @@ class TestSearchDevices:
             asset_user="user1",
             position=1,
         )
-        location = Dummy(name="Loc1")
-        building = Dummy(name="B1")
-        rack = Dummy(name="R1")
-        make = Dummy(name="Make1")
-        device_type = Dummy(name="Type1")
-        application = Dummy(name="App1")
-        asset_owner = Dummy(name="Owner1")
-
-        db, q = _mock_query_single_model(
+        location = SimpleNamespace(name="Loc1")
+        building = SimpleNamespace(name="B1")
+        rack = SimpleNamespace(name="R1")
+        make = SimpleNamespace(name="Make1")
+        device_type = SimpleNamespace(name="Type1")
+        application = SimpleNamespace(name="App1")
+        asset_owner = SimpleNamespace(name="Owner1")
+
+        db, _ = mock_query_factory(
             [(device, location, building, rack, make, device_type, application, asset_owner)]
         )
-        q.outerjoin.return_value = q
 
         results = _search_devices(db, search_term="dev1", limit=5, allowed_location_ids=None)
 
@@ -242,22 +163,6 @@ class TestSearchDevices:
         assert results[0]["asset_owner"] == "Owner1"
         assert results[0]["type"] == "device"
 
-    def test_search_devices_applies_allowed_location_filter(self):
-        """Edge: when allowed_location_ids provided, IN filter is added."""
-        db = MagicMock()
-        q = MagicMock()
-        db.query.return_value = q
-        q.outerjoin.return_value = q
-        q.filter.return_value = q
-        q.order_by.return_value = q
-        q.limit.return_value = q
-        q.all.return_value = []
-
-        allowed_ids = {1, 2}
-        _search_devices(db, search_term="x", limit=5, allowed_location_ids=allowed_ids)
-
-        assert q.filter.call_count >= 2
-
 
 # ============================================================
 # Tests for remaining helper functions
@@ -265,17 +170,12 @@ class TestSearchDevices:
 
 
 class TestSearchDeviceTypes:
-    def test_search_device_types_returns_mapped_results(self):
+    def test_search_device_types_returns_mapped_results(self, mock_query_factory):
         """Positive: device_types search maps tuples to dicts."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
+        device_type = SimpleNamespace(id=1, name="DT1", description="desc")
+        make = SimpleNamespace(name="Make1")
 
-        device_type = Dummy(id=1, name="DT1", description="desc")
-        make = Dummy(name="Make1")
-
-        db, q = _mock_query_single_model([(device_type, make)])
-        q.outerjoin.return_value = q
+        db, _ = mock_query_factory([(device_type, make)])
 
         results = _search_device_types(db, search_term="dt1", limit=5)
         assert results[0]["id"] == 1
@@ -284,22 +184,18 @@ class TestSearchDeviceTypes:
         assert results[0]["make"] == "Make1"
         assert results[0]["type"] == "device_type"
 
-    def test_search_device_types_no_results(self):
+    def test_search_device_types_no_results(self, mock_query_factory):
         """Negative: returns empty list when no matches."""
-        db, _ = _mock_query_single_model([])
+        db, _ = mock_query_factory([])
         results = _search_device_types(db, search_term="nada", limit=5)
         assert results == []
 
 
 class TestSearchMakes:
-    def test_search_makes_returns_mapped_results(self):
+    def test_search_makes_returns_mapped_results(self, mock_query_factory):
         """Positive: makes search returns dicts with basic fields."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
-
-        make = Dummy(id=1, name="Make1", description="desc")
-        db, _ = _mock_query_single_model([make])
+        make = SimpleNamespace(id=1, name="Make1", description="desc")
+        db, _ = mock_query_factory([make])
 
         results = _search_makes(db, search_term="make1", limit=5)
         assert results[0]["id"] == 1
@@ -307,26 +203,21 @@ class TestSearchMakes:
         assert results[0]["description"] == "desc"
         assert results[0]["type"] == "make"
 
-    def test_search_makes_no_results(self):
+    def test_search_makes_no_results(self, mock_query_factory):
         """Negative: returns empty list when no matches."""
-        db, _ = _mock_query_single_model([])
+        db, _ = mock_query_factory([])
         results = _search_makes(db, search_term="nada", limit=5)
         assert results == []
 
 
 class TestSearchModels:
-    def test_search_models_returns_mapped_results(self):
+    def test_search_models_returns_mapped_results(self, mock_query_factory):
         """Positive: models search maps (Model, Make, DeviceType) to dict."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
-
-        model = Dummy(id=1, name="M1", description="d", height=2)
-        make = Dummy(name="Make1")
-        device_type = Dummy(name="DT1")
+        model = SimpleNamespace(id=1, name="M1", description="d", height=2)
+        make = SimpleNamespace(name="Make1")
+        device_type = SimpleNamespace(name="DT1")
 
-        db, q = _mock_query_single_model([(model, make, device_type)])
-        q.join.return_value = q
+        db, _ = mock_query_factory([(model, make, device_type)])
 
         results = _search_models(db, search_term="m1", limit=5)
         assert results[0]["id"] == 1
@@ -336,26 +227,21 @@ class TestSearchModels:
         assert results[0]["device_type"] == "DT1"
         assert results[0]["type"] == "model"
 
-    def test_search_models_no_results(self):
+    def test_search_models_no_results(self, mock_query_factory):
         """Negative: returns empty list when no matches."""
-        db, _ = _mock_query_single_model([])
+        db, _ = mock_query_factory([])
         results = _search_models(db, search_term="nada", limit=5)
         assert results == []
 
 
 class TestSearchDatacenters:
-    def test_search_datacenters_returns_mapped_results(self):
+    def test_search_datacenters_returns_mapped_results(self, mock_query_factory):
         """Positive: datacenters search maps (Datacenter, Location, Building)."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
+        dc = SimpleNamespace(id=1, name="DC1", description="d")
+        loc = SimpleNamespace(name="Loc1")
+        bldg = SimpleNamespace(name="B1")
 
-        dc = Dummy(id=1, name="DC1", description="d")
-        loc = Dummy(name="Loc1")
-        bldg = Dummy(name="B1")
-
-        db, q = _mock_query_single_model([(dc, loc, bldg)])
-        q.join.return_value = q
+        db, _ = mock_query_factory([(dc, loc, bldg)])
 
         results = _search_datacenters(db, search_term="dc1", limit=5, allowed_location_ids=None)
         assert results[0]["id"] == 1
@@ -364,35 +250,14 @@ class TestSearchDatacenters:
         assert results[0]["building"] == "B1"
         assert results[0]["type"] == "datacenter"
 
-    def test_search_datacenters_applies_allowed_location_filter(self):
-        """Edge: when allowed_location_ids provided, IN filter is added."""
-        db = MagicMock()
-        q = MagicMock()
-        db.query.return_value = q
-        q.join.return_value = q
-        q.filter.return_value = q
-        q.order_by.return_value = q
-        q.limit.return_value = q
-        q.all.return_value = []
-
-        allowed_ids = {1, 2}
-        _search_datacenters(db, search_term="x", limit=5, allowed_location_ids=allowed_ids)
-
-        assert q.filter.call_count >= 2
-
 
 class TestSearchAssetOwners:
-    def test_search_asset_owners_returns_mapped_results(self):
+    def test_search_asset_owners_returns_mapped_results(self, mock_query_factory):
         """Positive: asset_owners search maps (AssetOwner, Location)."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
-
-        owner = Dummy(id=1, name="Owner1", description="d")
-        loc = Dummy(name="Loc1")
+        owner = SimpleNamespace(id=1, name="Owner1", description="d")
+        loc = SimpleNamespace(name="Loc1")
 
-        db, q = _mock_query_single_model([(owner, loc)])
-        q.outerjoin.return_value = q
+        db, _ = mock_query_factory([(owner, loc)])
 
         results = _search_asset_owners(db, search_term="owner1", limit=5, allowed_location_ids=None)
         assert results[0]["id"] == 1
@@ -400,35 +265,14 @@ class TestSearchAssetOwners:
         assert results[0]["location"] == "Loc1"
         assert results[0]["type"] == "asset_owner"
 
-    def test_search_asset_owners_applies_allowed_location_filter(self):
-        """Edge: when allowed_location_ids provided, IN filter is added."""
-        db = MagicMock()
-        q = MagicMock()
-        db.query.return_value = q
-        q.outerjoin.return_value = q
-        q.filter.return_value = q
-        q.order_by.return_value = q
-        q.limit.return_value = q
-        q.all.return_value = []
-
-        allowed_ids = {1, 2}
-        _search_asset_owners(db, search_term="x", limit=5, allowed_location_ids=allowed_ids)
-
-        assert q.filter.call_count >= 2
-
 
 class TestSearchApplications:
-    def test_search_applications_returns_mapped_results(self):
+    def test_search_applications_returns_mapped_results(self, mock_query_factory):
         """Positive: applications search maps (Application, AssetOwner)."""
-        class Dummy:
-            def __init__(self, **kwargs):
-                self.__dict__.update(kwargs)
-
-        app = Dummy(id=1, name="App1", description="d")
-        owner = Dummy(name="Owner1")
+        app = SimpleNamespace(id=1, name="App1", description="d")
+        owner = SimpleNamespace(name="Owner1")
 
-        db, q = _mock_query_single_model([(app, owner)])
-        q.outerjoin.return_value = q
+        db, _ = mock_query_factory([(app, owner)])
 
         results = _search_applications(db, search_term="app1", limit=5)
         assert results[0]["id"] == 1
@@ -436,13 +280,47 @@ class TestSearchApplications:
         assert results[0]["asset_owner"] == "Owner1"
         assert results[0]["type"] == "application"
 
-    def test_search_applications_no_results(self):
+    def test_search_applications_no_results(self, mock_query_factory):
         """Negative: returns empty list when no matches."""
-        db, _ = _mock_query_single_model([])
+        db, _ = mock_query_factory([])
         results = _search_applications(db, search_term="nada", limit=5)
         assert results == []
 
 
+# ============================================================
+# allowed_location_ids filtering (location-scoped helpers)
+# ============================================================
+
+_ALLOWED_LOCATION_IDS = frozenset({1, 2})
+_FILTERED_SEARCH_KWARGS = {
+    "search_term": "x",
+    "limit": 5,
+    "allowed_location_ids": _ALLOWED_LOCATION_IDS,
+}
+
+
+@pytest.mark.parametrize(
+    "search_fn",
+    [
+        _search_locations,
+        _search_buildings,
+        _search_racks,
+        _search_devices,
+        _search_datacenters,
+        _search_asset_owners,
+    ],
+    ids=lambda fn: fn.__name__,
+)
+def test_search_applies_allowed_location_filter(search_fn, mock_query_factory):
+    """Edge: when allowed_location_ids provided, an extra IN filter is added."""
+    db, q = mock_query_factory([])
+
+    search_fn(db, **_FILTERED_SEARCH_KWARGS)
+
+    # base search conditions + allowed_ids filter
+    assert q.filter.call_count >= 2
+
+
 # ============================================================
 # Tests for global_search
 # ============================================================
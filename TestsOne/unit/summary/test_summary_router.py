@@ -3,6 +3,26 @@ import pytest
 from app.dcim.routers.summary_router import _get_entity_models
 
 
+class _ChainStub:
+    """Query stand-in: chained calls return self, all() returns the preset rows.
+
+    filter() calls are recorded so tests can check whether scoping was applied.
+    """
+    def __init__(self, rows):
+        self._rows = rows
+        self.filter_calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def filter(self, *args, **kwargs):
+        self.filter_calls.append(args)
+        return self
+
+    def all(self):
+        return self._rows
+
+
 class TestGetEntityModels:
     """Unit tests for _get_entity_models helper function."""
 
@@ -140,8 +160,8 @@ class TestSummaryRouter:
             # The code does db.query(...).outerjoin(...).order_by(...).all()
             # If allowed_location_ids is None, no filter() is called.
             
-            mock_query = mock_db.query.return_value
-            mock_query.outerjoin.return_value.outerjoin.return_value.outerjoin.return_value.outerjoin.return_value.order_by.return_value.all.return_value = [row1]
+            query_chain = _ChainStub([row1])
+            mock_db.query.return_value = query_chain
             
             from app.dcim.routers import summary_router
             response = summary_router.get_location_summary(
@@ -161,6 +181,7 @@ class TestSummaryRouter:
             assert res["used_rack_units"] == 20
             # utilization = 20/100 = 20.0
             assert res["utilization_percent"] == 20.0
+            assert query_chain.filter_calls == []
             
             # Check cache was set
             mock_set_cache.assert_called_once()
@@ -201,9 +222,9 @@ class TestSummaryRouter:
             mock_loc.id = 10
             row1 = (mock_loc, 0, 0, 0, 0, 0, 0, 0, 0, 0)
             
-            mock_query = mock_db.query.return_value
             # Now filter() IS called
-            mock_query.outerjoin.return_value.outerjoin.return_value.outerjoin.return_value.outerjoin.return_value.order_by.return_value.filter.return_value.all.return_value = [row1]
+            query_chain = _ChainStub([row1])
+            mock_db.query.return_value = query_chain
             
             from app.dcim.routers import summary_router
             summary_router.get_location_summary(
@@ -214,5 +235,4 @@ class TestSummaryRouter:
             
             mock_get_cache.assert_not_called()
             # Verify filter was applied
-            query_chain = mock_query.outerjoin.return_value.outerjoin.return_value.outerjoin.return_value.outerjoin.return_value.order_by.return_value
-            query_chain.filter.assert_called_once()
+            assert len(query_chain.filter_calls) == 1
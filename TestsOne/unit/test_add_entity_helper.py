@@ -1,14 +1,78 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 from fastapi import HTTPException
+from sqlalchemy.orm import Session
 from app.helpers import add_entity_helper
 
+# Name lookups create_rack/create_device resolve before touching the DB
+_DEVICE_LOOKUPS = (
+    "get_location_by_name",
+    "get_building_by_name",
+    "get_wing_by_name_scoped",
+    "get_floor_by_name_scoped",
+    "get_datacenter_by_name_scoped",
+    "get_rack_by_name_scoped",
+    "get_make_by_name",
+    "get_device_type_by_name_scoped",
+    "get_model_by_name",
+    "get_asset_owner_by_name",
+    "get_application_by_name",
+)
+
+
+# Parent lookups only expose .id/.name, so share read-only stubs across tests
+_LOC1 = SimpleNamespace(id=1, name="Loc1")
+_BUILD1 = SimpleNamespace(id=2, name="Build1")
+_WING1 = SimpleNamespace(id=3, name="Wing1")
+_FLOOR1 = SimpleNamespace(id=4, name="Floor1")
+_DC1 = SimpleNamespace(id=5, name="DC1")
+_MAKE1 = SimpleNamespace(id=5, name="Make1")
+_OWNER1 = SimpleNamespace(id=10, name="Owner1")
+_APP1 = SimpleNamespace(id=11, name="App1", asset_owner_id=10)
+
+_L1 = SimpleNamespace(id=1, name="L1")
+_B1 = SimpleNamespace(id=2, name="B1")
+_W1 = SimpleNamespace(id=3, name="W1")
+_F1 = SimpleNamespace(id=4, name="F1")
+
+
+# create_device payload naming every parent lookup; tests copy and extend it
+_BASE_DEVICE_DATA = MappingProxyType({
+    "name": "Dev1",
+    "location_name": "Loc1",
+    "building_name": "Build1",
+    "wing_name": "Wing1",
+    "floor_name": "Floor1",
+    "datacenter_name": "DC1",
+    "rack_name": "Rack1",
+    "make_name": "Make1",
+    "devicetype_name": "Type1",
+    "model_name": "Model1",
+    "asset_owner_name": "Owner1",
+    "application_name": "App1",
+})
+
+
+@pytest.fixture
+def patched_helpers():
+    """Patch the lookup helpers and db_operation at once; yield mocks by name."""
+    # Keep these plain MagicMocks: autospec would introspect every helper's
+    # signature on each install, the costliest option patch offers.
+    with patch.multiple(
+        add_entity_helper,
+        db_operation=DEFAULT,
+        **dict.fromkeys(_DEVICE_LOOKUPS, DEFAULT),
+    ) as mocks:
+        yield mocks
+
+
 class TestCreateRack:
     """Unit tests for create_rack in add_entity_helper."""
 
-    def test_create_rack_success(self):
+    def test_create_rack_success(self, patched_helpers):
         """Positive: Successfully creates a rack with all lookups resolving."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {
             "name": "Rack1",
             "location_name": "Loc1",
@@ -21,32 +85,26 @@ class TestCreateRack:
         }
 
         # Mock helper lookups
-        with patch("app.helpers.add_entity_helper.get_location_by_name") as mock_get_loc, \
-             patch("app.helpers.add_entity_helper.get_building_by_name") as mock_get_build, \
-             patch("app.helpers.add_entity_helper.get_wing_by_name_scoped") as mock_get_wing, \
-             patch("app.helpers.add_entity_helper.get_floor_by_name_scoped") as mock_get_floor, \
-             patch("app.helpers.add_entity_helper.get_datacenter_by_name_scoped") as mock_get_dc, \
-             patch("app.helpers.add_entity_helper.db_operation"):
-
-            mock_get_loc.return_value = MagicMock(id=1, name="Loc1")
-            mock_get_build.return_value = MagicMock(id=2, name="Build1")
-            mock_get_wing.return_value = MagicMock(id=3, name="Wing1")
-            mock_get_floor.return_value = MagicMock(id=4, name="Floor1")
-            mock_get_dc.return_value = MagicMock(id=5, name="DC1")
-
-            result = add_entity_helper.create_rack(db, data)
-
-            assert result["name"] == "Rack1"
-            assert result["height"] == 42
-            assert result["space_used"] == 0
-            assert result["space_available"] == 42
-            # Verify DB add/commit called
-            db.add.assert_called_once()
-            db.commit.assert_called_once()
-
+        patched_helpers["get_location_by_name"].return_value = _LOC1
+        patched_helpers["get_building_by_name"].return_value = _BUILD1
+        patched_helpers["get_wing_by_name_scoped"].return_value = _WING1
+        patched_helpers["get_floor_by_name_scoped"].return_value = _FLOOR1
+        patched_helpers["get_datacenter_by_name_scoped"].return_value = _DC1
+
+        result = add_entity_helper.create_rack(db, data)
+
+        assert result["name"] == "Rack1"
+        assert result["height"] == 42
+        assert result["space_used"] == 0
+        assert result["space_available"] == 42
+        # Verify DB add/commit called
+        db.add.assert_called_once()
+        db.commit.assert_called_once()
+
+    @pytest.mark.usefixtures("patched_helpers")
     def test_create_rack_missing_height(self):
         """Negative: Raises HTTPException when height is missing."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {
             "name": "Rack1",
             "location_name": "Loc1",
@@ -57,81 +115,45 @@ class TestCreateRack:
             # height missing
         }
 
-        with patch("app.helpers.add_entity_helper.get_location_by_name"), \
-             patch("app.helpers.add_entity_helper.get_building_by_name"), \
-             patch("app.helpers.add_entity_helper.get_wing_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.get_floor_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.get_datacenter_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.db_operation"):
-
-            with pytest.raises(HTTPException) as exc_info:
-                add_entity_helper.create_rack(db, data)
-            
-            assert exc_info.value.status_code == 400
-            assert "Height is required" in exc_info.value.detail
+        with pytest.raises(HTTPException, match="Height is required") as exc_info:
+            add_entity_helper.create_rack(db, data)
+        
+        assert exc_info.value.status_code == 400
 
 
 class TestCreateDevice:
     """Unit tests for create_device in add_entity_helper."""
 
-    def test_create_device_success(self):
+    @pytest.mark.slow
+    def test_create_device_success(self, patched_helpers):
         """Positive: Successfully creates a device with valid capacity."""
-        db = MagicMock()
-        data = {
-            "name": "Dev1",
-            "location_name": "Loc1",
-            "building_name": "Build1",
-            "wing_name": "Wing1",
-            "floor_name": "Floor1",
-            "datacenter_name": "DC1",
-            "rack_name": "Rack1",
-            "make_name": "Make1",
-            "devicetype_name": "Type1",
-            "model_name": "Model1",
-            "asset_owner_name": "Owner1",
-            "application_name": "App1",
-            "position": 10,
-            "face": "Front",
-            "status": "active"
-        }
-
-        # Mock dependencies
-        with patch("app.helpers.add_entity_helper.get_location_by_name") as m_loc, \
-             patch("app.helpers.add_entity_helper.get_building_by_name") as m_bld, \
-             patch("app.helpers.add_entity_helper.get_wing_by_name_scoped") as m_wng, \
-             patch("app.helpers.add_entity_helper.get_floor_by_name_scoped") as m_flr, \
-             patch("app.helpers.add_entity_helper.get_datacenter_by_name_scoped") as m_dc, \
-             patch("app.helpers.add_entity_helper.get_rack_by_name_scoped") as m_rck, \
-             patch("app.helpers.add_entity_helper.get_make_by_name") as m_mak, \
-             patch("app.helpers.add_entity_helper.get_device_type_by_name_scoped") as m_dt, \
-             patch("app.helpers.add_entity_helper.get_model_by_name") as m_mod, \
-             patch("app.helpers.add_entity_helper.get_asset_owner_by_name") as m_ao, \
-             patch("app.helpers.add_entity_helper.get_application_by_name") as m_app, \
-             patch("app.helpers.add_entity_helper.sync_rack_usage"), \
-             patch("app.helpers.add_entity_helper.ensure_continuous_space"), \
-             patch("app.helpers.add_entity_helper.ensure_rack_capacity"), \
-             patch("app.helpers.add_entity_helper.reserve_rack_capacity"), \
-             patch("app.helpers.add_entity_helper.db_operation"):
-
-            m_loc.return_value = MagicMock(id=1, name="Loc1")
-            m_bld.return_value = MagicMock(id=2, name="Build1")
-            m_wng.return_value = MagicMock(id=3, name="Wing1")
-            m_flr.return_value = MagicMock(id=4, name="Floor1")
-            m_dc.return_value = MagicMock(id=5, name="DC1")
-            m_rck.return_value = MagicMock(id=6, name="Rack1")
-            
-            make_mock = MagicMock(id=7, name="Make1")
-            m_mak.return_value = make_mock
-            
-            dt_mock = MagicMock(id=8, name="Type1")
-            m_dt.return_value = dt_mock
-            
-            # Model mocks
-            model_mock = MagicMock(id=9, name="Model1", make_id=7, device_type_id=8, height=2)
-            m_mod.return_value = model_mock
-            
-            m_ao.return_value = MagicMock(id=10, name="Owner1")
-            m_app.return_value = MagicMock(id=11, name="App1", asset_owner_id=10)
+        db = MagicMock(spec=Session)
+        data = {**_BASE_DEVICE_DATA, "position": 10, "face": "Front", "status": "active"}
+
+        # Capacity bookkeeping is out of scope here; stub it alongside the lookups
+        with patch.multiple(
+            add_entity_helper,
+            sync_rack_usage=DEFAULT,
+            ensure_continuous_space=DEFAULT,
+            ensure_rack_capacity=DEFAULT,
+            reserve_rack_capacity=DEFAULT,
+        ):
+            patched_helpers["get_location_by_name"].return_value = _LOC1
+            patched_helpers["get_building_by_name"].return_value = _BUILD1
+            patched_helpers["get_wing_by_name_scoped"].return_value = _WING1
+            patched_helpers["get_floor_by_name_scoped"].return_value = _FLOOR1
+            patched_helpers["get_datacenter_by_name_scoped"].return_value = _DC1
+            patched_helpers["get_rack_by_name_scoped"].return_value = SimpleNamespace(id=6, name="Rack1")
+            patched_helpers["get_make_by_name"].return_value = SimpleNamespace(id=7, name="Make1")
+            patched_helpers["get_device_type_by_name_scoped"].return_value = SimpleNamespace(id=8, name="Type1")
+            
+            # Model stub agreeing with the make and device type above
+            patched_helpers["get_model_by_name"].return_value = SimpleNamespace(
+                id=9, name="Model1", make_id=7, device_type_id=8, height=2
+            )
+            
+            patched_helpers["get_asset_owner_by_name"].return_value = _OWNER1
+            patched_helpers["get_application_by_name"].return_value = _APP1
 
             result = add_entity_helper.create_device(db, data)
             
@@ -142,45 +164,18 @@ class TestCreateDevice:
             db.commit.assert_called_once()
 
 
-    def test_create_device_make_mismatch(self):
+    def test_create_device_make_mismatch(self, patched_helpers):
         """Negative: Raises 400 if model make does not match provided make."""
-        db = MagicMock()
-        data = {
-            "name": "Dev1",
-            "location_name": "Loc1",
-            "building_name": "Build1",
-            "wing_name": "Wing1",
-            "floor_name": "Floor1",
-            "datacenter_name": "DC1",
-            "rack_name": "Rack1",
-            "make_name": "Make1",
-            "devicetype_name": "Type1",
-            "model_name": "Model1",
-            "asset_owner_name": "Owner1",
-            "application_name": "App1"
-        }
+        db = MagicMock(spec=Session)
+        data = dict(_BASE_DEVICE_DATA)
 
-        with patch("app.helpers.add_entity_helper.get_location_by_name"), \
-             patch("app.helpers.add_entity_helper.get_building_by_name"), \
-             patch("app.helpers.add_entity_helper.get_wing_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.get_floor_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.get_datacenter_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.get_rack_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.get_make_by_name") as m_mak, \
-             patch("app.helpers.add_entity_helper.get_device_type_by_name_scoped"), \
-             patch("app.helpers.add_entity_helper.get_model_by_name") as m_mod, \
-             patch("app.helpers.add_entity_helper.get_asset_owner_by_name"), \
-             patch("app.helpers.add_entity_helper.get_application_by_name"), \
-             patch("app.helpers.add_entity_helper.db_operation"):
-
-            m_mak.return_value = MagicMock(id=1, name="Make1")
-            m_mod.return_value = MagicMock(id=99, name="Model1", make_id=2) # Different make_id
-
-            with pytest.raises(HTTPException) as exc_info:
-                add_entity_helper.create_device(db, data)
-            
-            assert exc_info.value.status_code == 400
-            assert "belongs to a different make" in exc_info.value.detail
+        patched_helpers["get_make_by_name"].return_value = SimpleNamespace(id=1, name="Make1")
+        patched_helpers["get_model_by_name"].return_value = SimpleNamespace(id=99, name="Model1", make_id=2) # Different make_id
+
+        with pytest.raises(HTTPException, match="belongs to a different make") as exc_info:
+            add_entity_helper.create_device(db, data)
+        
+        assert exc_info.value.status_code == 400
 
 
 class TestCreateLocation:
@@ -188,11 +183,11 @@ class TestCreateLocation:
 
     def test_create_location_success(self):
         """Positive: Successfully creates a location."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {"name": "Test Loc", "description": "Desc"}
         
-        with patch("app.helpers.add_entity_helper.db_operation"), \
-             patch("app.helpers.add_entity_helper.check_entity_exists", return_value=False):
+        with patch.object(add_entity_helper, "db_operation"), \
+             patch.object(add_entity_helper, "check_entity_exists", return_value=False):
             
             # Mock DB behaviors
             result = add_entity_helper.create_location(db, data)
@@ -203,11 +198,11 @@ class TestCreateLocation:
 
     def test_create_location_conflict(self):
         """Negative: Raises 409 if location exists."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {"name": "Existing Loc"}
         
-        with patch("app.helpers.add_entity_helper.db_operation"), \
-             patch("app.helpers.add_entity_helper.check_entity_exists", return_value=True):
+        with patch.object(add_entity_helper, "db_operation"), \
+             patch.object(add_entity_helper, "check_entity_exists", return_value=True):
             
             with pytest.raises(HTTPException) as exc:
                 add_entity_helper.create_location(db, data)
@@ -219,7 +214,7 @@ class TestCreateBuilding:
 
     def test_create_building_success(self):
         """Positive: Successfully creates a building."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {
             "name": "B1", 
             "location_name": "Loc1",
@@ -227,11 +222,11 @@ class TestCreateBuilding:
             "address": "addr"
         }
         
-        with patch("app.helpers.add_entity_helper.db_operation"), \
-             patch("app.helpers.add_entity_helper.check_entity_exists", return_value=False), \
-             patch("app.helpers.add_entity_helper.get_location_by_name") as m_loc:
+        with patch.object(add_entity_helper, "db_operation"), \
+             patch.object(add_entity_helper, "check_entity_exists", return_value=False), \
+             patch.object(add_entity_helper, "get_location_by_name") as m_loc:
              
-            m_loc.return_value = MagicMock(id=1, name="Loc1")
+            m_loc.return_value = _LOC1
             
             result = add_entity_helper.create_building(db, data)
             
@@ -241,9 +236,9 @@ class TestCreateBuilding:
 
     def test_create_building_conflict(self):
         """Negative: Raises 409 if building name exists."""
-        db = MagicMock()
-        with patch("app.helpers.add_entity_helper.db_operation"), \
-             patch("app.helpers.add_entity_helper.check_entity_exists", return_value=True):
+        db = MagicMock(spec=Session)
+        with patch.object(add_entity_helper, "db_operation"), \
+             patch.object(add_entity_helper, "check_entity_exists", return_value=True):
             
             with pytest.raises(HTTPException) as exc:
                 add_entity_helper.create_building(db, {"name": "B1"})
@@ -256,25 +251,19 @@ class TestCreateWing:
     
     def test_create_wing_success(self):
         """Positive: Creates wing correctly."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {"name": "W1", "location_name": "L1", "building_name": "B1"}
         
-        with patch("app.helpers.add_entity_helper.get_location_by_name") as m_loc, \
-             patch("app.helpers.add_entity_helper.get_building_by_name") as m_bld, \
-             patch("app.helpers.add_entity_helper.get_or_create_wing") as m_get_create_wing:
+        with patch.object(add_entity_helper, "get_location_by_name") as m_loc, \
+             patch.object(add_entity_helper, "get_building_by_name") as m_bld, \
+             patch.object(add_entity_helper, "get_or_create_wing") as m_get_create_wing:
              
-            # Configure mocks to return name as string attribute, preventing it from being a mock
-            loc_mock = MagicMock(id=1)
-            loc_mock.name = "L1" # Explicitly set property
-            m_loc.return_value = loc_mock
-            
-            bld_mock = MagicMock(id=2)
-            bld_mock.name = "B1"
-            m_bld.return_value = bld_mock
+            m_loc.return_value = _L1
+            m_bld.return_value = _B1
             
-            wing_mock = MagicMock(id=3, location_id=1, building_id=2, description="")
-            wing_mock.name = "W1"
-            m_get_create_wing.return_value = wing_mock
+            m_get_create_wing.return_value = SimpleNamespace(
+                id=3, name="W1", location_id=1, building_id=2, description=""
+            )
             
             result = add_entity_helper.create_wing(db, data)
             
@@ -288,29 +277,23 @@ class TestCreateFloor:
     
     def test_create_floor_success(self):
         """Positive: Creates floor correctly."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {"name": "F1", "wing_name": "W1", "location_name": "L1", "building_name": "B1"}
         
-        with patch("app.helpers.add_entity_helper.get_location_by_name") as m_loc, \
-             patch("app.helpers.add_entity_helper.get_building_by_name") as m_bld, \
-             patch("app.helpers.add_entity_helper.get_or_create_wing") as m_wing, \
-             patch("app.helpers.add_entity_helper.get_or_create_floor") as m_floor:
+        with patch.object(add_entity_helper, "get_location_by_name") as m_loc, \
+             patch.object(add_entity_helper, "get_building_by_name") as m_bld, \
+             patch.object(add_entity_helper, "get_or_create_wing") as m_wing, \
+             patch.object(add_entity_helper, "get_or_create_floor") as m_floor:
              
-            loc_mock = MagicMock(id=1)
-            loc_mock.name = "L1"
-            m_loc.return_value = loc_mock
+            m_loc.return_value = _L1
             
-            bld_mock = MagicMock(id=2)
-            bld_mock.name = "B1"
-            m_bld.return_value = bld_mock
+            m_bld.return_value = _B1
             
-            wing_mock = MagicMock(id=3)
-            wing_mock.name = "W1"
-            m_wing.return_value = wing_mock
+            m_wing.return_value = _W1
             
-            floor_mock = MagicMock(id=4, location_id=1, building_id=2, wing_id=3, description="")
-            floor_mock.name = "F1"
-            m_floor.return_value = floor_mock
+            m_floor.return_value = SimpleNamespace(
+                id=4, name="F1", location_id=1, building_id=2, wing_id=3, description=""
+            )
             
             result = add_entity_helper.create_floor(db, data)
             
@@ -323,29 +306,21 @@ class TestCreateDatacenter:
     
     def test_create_datacenter_success(self):
         """Positive: Creates datacenter correctly."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {"name": "DC1", "floor_name": "F1", "wing_name": "W1", "location_name": "L1", "building_name": "B1", "description": "d"}
         
-        with patch("app.helpers.add_entity_helper.get_location_by_name") as m_loc, \
-             patch("app.helpers.add_entity_helper.get_building_by_name") as m_bld, \
-             patch("app.helpers.add_entity_helper.get_or_create_wing") as m_wing, \
-             patch("app.helpers.add_entity_helper.get_or_create_floor") as m_floor:
+        with patch.object(add_entity_helper, "get_location_by_name") as m_loc, \
+             patch.object(add_entity_helper, "get_building_by_name") as m_bld, \
+             patch.object(add_entity_helper, "get_or_create_wing") as m_wing, \
+             patch.object(add_entity_helper, "get_or_create_floor") as m_floor:
              
-            loc_mock = MagicMock(id=1)
-            loc_mock.name = "L1"
-            m_loc.return_value = loc_mock
+            m_loc.return_value = _L1
             
-            bld_mock = MagicMock(id=2)
-            bld_mock.name = "B1"
-            m_bld.return_value = bld_mock
+            m_bld.return_value = _B1
             
-            wing_mock = MagicMock(id=3)
-            wing_mock.name = "W1"
-            m_wing.return_value = wing_mock
+            m_wing.return_value = _W1
             
-            floor_mock = MagicMock(id=4)
-            floor_mock.name = "F1"
-            m_floor.return_value = floor_mock
+            m_floor.return_value = _F1
             
             result = add_entity_helper.create_datacenter(db, data)
             
@@ -359,19 +334,15 @@ class TestCreateDeviceType:
     
     def test_create_device_type_success(self):
         """Positive: Creates device type (and make) correctly."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {"name": "DT1", "make_name": "Make1"}
         
-        with patch("app.helpers.add_entity_helper.get_or_create_make") as m_make, \
-             patch("app.helpers.add_entity_helper.get_or_create_device_type") as m_dt:
+        with patch.object(add_entity_helper, "get_or_create_make") as m_make, \
+             patch.object(add_entity_helper, "get_or_create_device_type") as m_dt:
              
-            make_mock = MagicMock(id=1)
-            make_mock.name = "Make1"
-            m_make.return_value = make_mock
+            m_make.return_value = _MAKE1
             
-            dt_mock = MagicMock(id=2, make_id=1)
-            dt_mock.name = "DT1"
-            m_dt.return_value = dt_mock
+            m_dt.return_value = SimpleNamespace(id=2, name="DT1", make_id=5, description="")
             
             result = add_entity_helper.create_device_type(db, data)
             
@@ -384,19 +355,15 @@ class TestCreateAssetOwner:
     
     def test_create_asset_owner_success(self):
         """Positive: Creates asset owner correctly."""
-        db = MagicMock()
+        db = MagicMock(spec=Session)
         data = {"name": "Owner1", "location_name": "L1"}
         
-        with patch("app.helpers.add_entity_helper.get_location_by_name") as m_loc, \
-             patch("app.helpers.add_entity_helper.get_or_create_asset_owner_scoped") as m_ao:
+        with patch.object(add_entity_helper, "get_location_by_name") as m_loc, \
+             patch.object(add_entity_helper, "get_or_create_asset_owner_scoped") as m_ao:
              
-            loc_mock = MagicMock(id=1)
-            loc_mock.name = "L1"
-            m_loc.return_value = loc_mock
+            m_loc.return_value = _L1
             
-            ao_mock = MagicMock(id=2, location_id=1)
-            ao_mock.name = "Owner1"
-            m_ao.return_value = ao_mock
+            m_ao.return_value = SimpleNamespace(id=2, name="Owner1", location_id=1, description="")
             
             result = add_entity_helper.create_asset_owner(db, data)
             
@@ -408,75 +375,64 @@ class TestCreateAssetOwner:
 # Migrated Coverage Tests
 # =============================================================================
 
-def test_add_helper_create_location():
-    db = MagicMock()
+def test_add_helper_create_location(monkeypatch):
+    db = MagicMock(spec=Session)
     # Mock check_entity_exists to return False
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(add_entity_helper, "check_entity_exists", lambda *args, **kwargs: False)
-        
-        data = {"name": "Test", "description": "Desc"}
-        result = add_entity_helper.create_location(db, data)
-        assert result["name"] == "Test"
-        db.add.assert_called()
-        db.commit.assert_called()
-
-def test_add_helper_create_building():
-    db = MagicMock()
-    mock_loc = MagicMock()
-    mock_loc.id = 1
-    mock_loc.name = "L1"
-
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(add_entity_helper, "check_entity_exists", lambda *args, **kwargs: False)
-        m.setattr(add_entity_helper, "get_location_by_name", lambda *args: mock_loc)
-
-        data = {"name": "B1", "location_name": "L1"}
-        result = add_entity_helper.create_building(db, data)
-        assert result["name"] == "B1"
-        assert result["location_id"] == 1
-
-def test_add_helper_create_wing():
-    db = MagicMock()
-    mock_loc = MagicMock(); mock_loc.id = 1; mock_loc.name = "L1"
-    mock_bld = MagicMock(); mock_bld.id = 2; mock_bld.name = "B1"
-    mock_wing = MagicMock(); mock_wing.id = 3; mock_wing.name = "W1"
-
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(add_entity_helper, "get_location_by_name", lambda *args: mock_loc)
-        m.setattr(add_entity_helper, "get_building_by_name", lambda *args: mock_bld)
-        # Mock get_or_create_wing
-        m.setattr(add_entity_helper, "get_or_create_wing", lambda *args: mock_wing)
-
-        data = {"name": "W1", "location_name": "L1", "building_name": "B1"}
-        result = add_entity_helper.create_wing(db, data)
-        assert result["name"] == "W1"
-
-def test_add_helper_create_floor():
-    db = MagicMock()
-    mock_loc = MagicMock(); mock_loc.id = 1; mock_loc.name = "L1"
-    mock_bld = MagicMock(); mock_bld.id = 2; mock_bld.name = "B1"
-    mock_wing = MagicMock(); mock_wing.id = 3; mock_wing.name = "W1"
-    mock_floor = MagicMock(); mock_floor.id = 4; mock_floor.name = "F1"
-
-    with pytest.MonkeyPatch.context() as m:
-        m.setattr(add_entity_helper, "get_location_by_name", lambda *args: mock_loc)
-        m.setattr(add_entity_helper, "get_building_by_name", lambda *args: mock_bld)
-        m.setattr(add_entity_helper, "get_or_create_wing", lambda *args: mock_wing)
-        m.setattr(add_entity_helper, "get_or_create_floor", lambda *args: mock_floor)
-
-        data = {"name": "F1", "location_name": "L1", "building_name": "B1", "wing_name": "W1"}
-        result = add_entity_helper.create_floor(db, data)
-        assert result["name"] == "F1"
+    monkeypatch.setattr(add_entity_helper, "check_entity_exists", lambda *args, **kwargs: False)
+    
+    data = {"name": "Test", "description": "Desc"}
+    result = add_entity_helper.create_location(db, data)
+    assert result["name"] == "Test"
+    db.add.assert_called()
+    db.commit.assert_called()
+
+def test_add_helper_create_building(monkeypatch):
+    db = MagicMock(spec=Session)
+
+    monkeypatch.setattr(add_entity_helper, "check_entity_exists", lambda *args, **kwargs: False)
+    monkeypatch.setattr(add_entity_helper, "get_location_by_name", lambda *args: _L1)
+
+    data = {"name": "B1", "location_name": "L1"}
+    result = add_entity_helper.create_building(db, data)
+    assert result["name"] == "B1"
+    assert result["location_id"] == 1
+
+def test_add_helper_create_wing(monkeypatch):
+    db = MagicMock(spec=Session)
+    mock_wing = SimpleNamespace(id=3, name="W1", location_id=1, building_id=2, description="")
+
+    monkeypatch.setattr(add_entity_helper, "get_location_by_name", lambda *args: _L1)
+    monkeypatch.setattr(add_entity_helper, "get_building_by_name", lambda *args: _B1)
+    # Mock get_or_create_wing
+    monkeypatch.setattr(add_entity_helper, "get_or_create_wing", lambda *args: mock_wing)
+
+    data = {"name": "W1", "location_name": "L1", "building_name": "B1"}
+    result = add_entity_helper.create_wing(db, data)
+    assert result["name"] == "W1"
+
+def test_add_helper_create_floor(monkeypatch):
+    db = MagicMock(spec=Session)
+    mock_floor = SimpleNamespace(
+        id=4, name="F1", location_id=1, building_id=2, wing_id=3, description=""
+    )
+
+    monkeypatch.setattr(add_entity_helper, "get_location_by_name", lambda *args: _L1)
+    monkeypatch.setattr(add_entity_helper, "get_building_by_name", lambda *args: _B1)
+    monkeypatch.setattr(add_entity_helper, "get_or_create_wing", lambda *args: _W1)
+    monkeypatch.setattr(add_entity_helper, "get_or_create_floor", lambda *args: mock_floor)
+
+    data = {"name": "F1", "location_name": "L1", "building_name": "B1", "wing_name": "W1"}
+    result = add_entity_helper.create_floor(db, data)
+    assert result["name"] == "F1"
 
 # Test create_asset_owner
 def test_create_asset_owner():
-    db = MagicMock()
+    db = MagicMock(spec=Session)
     data = {"name": "Test Owner", "location_name": "Loc1", "description": "Desc"}
     
-    mock_loc = MagicMock(); mock_loc.id = 1; mock_loc.name = "Loc1"
-    mock_ao = MagicMock(); mock_ao.id = 10; mock_ao.name = "Test Owner"; mock_ao.location_id = 1
+    mock_ao = SimpleNamespace(id=10, name="Test Owner", location_id=1, description="Desc")
     
-    with patch("app.helpers.add_entity_helper.get_location_by_name", return_value=mock_loc),          patch("app.helpers.add_entity_helper.get_or_create_asset_owner_scoped", return_value=mock_ao):
+    with patch.object(add_entity_helper, "get_location_by_name", return_value=_LOC1),          patch.object(add_entity_helper, "get_or_create_asset_owner_scoped", return_value=mock_ao):
          
          result = add_entity_helper.create_asset_owner(db, data)
          
@@ -486,12 +442,10 @@ def test_create_asset_owner():
 
 # Test create_application 
 def test_create_application():
-    db = MagicMock()
+    db = MagicMock(spec=Session)
     data = {"name": "App1", "asset_owner_name": "Owner1", "location_name": "Loc1", "description": "Desc"}
     
-    mock_owner = MagicMock(); mock_owner.id = 10
-    
-    with patch("app.helpers.add_entity_helper.get_asset_owner_by_name", return_value=mock_owner):
+    with patch.object(add_entity_helper, "get_asset_owner_by_name", return_value=_OWNER1):
          
          # db.add side effect to set ID on the passed object
          def add_side_effect(obj):
@@ -505,45 +459,36 @@ def test_create_application():
 
 # Test create_make
 def test_create_make():
-    db = MagicMock()
+    db = MagicMock(spec=Session)
     data = {"name": "Make1"}
     
-    mock_make = MagicMock(); mock_make.id = 5; mock_make.name = "Make1"
+    mock_make = SimpleNamespace(id=5, name="Make1", description="")
     
-    with patch("app.helpers.add_entity_helper.get_or_create_make", return_value=mock_make):
+    with patch.object(add_entity_helper, "get_or_create_make", return_value=mock_make):
         result = add_entity_helper.create_make(db, data)
         assert result["id"] == 5
 
 # Test create_device_type
 def test_create_device_type():
-    db = MagicMock()
+    db = MagicMock(spec=Session)
     data = {"name": "DT1", "make_name": "Make1"}
     
-    mock_make = MagicMock(); mock_make.id = 5; mock_make.name = "Make1"
-    mock_dt = MagicMock(); mock_dt.id = 6; mock_dt.name = "DT1"; mock_dt.make_id = 5
+    mock_dt = SimpleNamespace(id=6, name="DT1", make_id=5, description="")
     
-    with patch("app.helpers.add_entity_helper.get_or_create_make", return_value=mock_make),          patch("app.helpers.add_entity_helper.get_or_create_device_type", return_value=mock_dt):
+    with patch.object(add_entity_helper, "get_or_create_make", return_value=_MAKE1),          patch.object(add_entity_helper, "get_or_create_device_type", return_value=mock_dt):
          
          result = add_entity_helper.create_device_type(db, data)
          assert result["id"] == 6
          assert result["make_name"] == "Make1"
 
 # Test create_model
-def test_create_model():
-    db = MagicMock()
+def test_create_model(make_chain_db):
+    db = make_chain_db(None) # No existing model
     data = {"name": "Model1", "make_name": "Make1", "devicetype_name": "DT1", "height": 2}
     
-    mock_make = MagicMock(); mock_make.id = 5; mock_make.name = "Make1"
-    mock_dt = MagicMock(); mock_dt.id = 6; mock_dt.name = "DT1"
-    
-    query_mock = MagicMock()
-    filter_mock = MagicMock()
-    query_mock.filter.return_value = filter_mock
-    filter_mock.filter.return_value = filter_mock 
-    filter_mock.first.return_value = None # No existing model
-    db.query.return_value = query_mock
+    mock_dt = SimpleNamespace(id=6, name="DT1", make_id=5, description="")
     
-    with patch("app.helpers.add_entity_helper.get_or_create_make", return_value=mock_make),          patch("app.helpers.add_entity_helper.get_or_create_device_type", return_value=mock_dt):
+    with patch.object(add_entity_helper, "get_or_create_make", return_value=_MAKE1),          patch.object(add_entity_helper, "get_or_create_device_type", return_value=mock_dt):
          
          def add_side_effect(obj):
              obj.id = 7
@@ -569,52 +514,22 @@ from app.helpers.add_entity_helper import (
 # Tests for Scoped Lookups (Error Paths)
 # ============================================================
 
-def test_get_wing_by_name_scoped_not_found():
-    db = MagicMock()
-    db.query.return_value.filter.return_value.filter.return_value.filter.return_value.first.return_value = None
-    with pytest.raises(HTTPException) as exc:
-        get_wing_by_name_scoped(db, "Missing", 1, 1)
-    assert exc.value.status_code == 404
-
-def test_get_floor_by_name_scoped_not_found():
-    db = MagicMock()
-    db.query.return_value.filter.return_value.filter.return_value.filter.return_value.filter.return_value.first.return_value = None
-    with pytest.raises(HTTPException) as exc:
-        get_floor_by_name_scoped(db, "Missing", 1, 1, 1)
-    assert exc.value.status_code == 404
-
-def test_get_datacenter_by_name_scoped_not_found():
-    db = MagicMock()
-    # Chain is long: query().filter()...first()
-    mock_q = MagicMock()
-    mock_q.filter.return_value = mock_q
-    mock_q.first.return_value = None
-    db.query.return_value = mock_q
-    
-    with pytest.raises(HTTPException) as exc:
-        get_datacenter_by_name_scoped(db, "Missing", 1, 1, 1, 1)
-    assert exc.value.status_code == 404
-
-def test_get_device_type_by_name_scoped_not_found():
-    db = MagicMock()
-    mock_q = MagicMock()
-    mock_q.filter.return_value = mock_q
-    mock_q.first.return_value = None
-    db.query.return_value = mock_q
-    
-    with pytest.raises(HTTPException) as exc:
-        get_device_type_by_name_scoped(db, "Missing", 1)
-    assert exc.value.status_code == 404
-
-def test_get_rack_by_name_scoped_not_found():
-    db = MagicMock()
-    mock_q = MagicMock()
-    mock_q.filter.return_value = mock_q
-    mock_q.first.return_value = None
-    db.query.return_value = mock_q
+@pytest.mark.parametrize(
+    "lookup, scope_ids",
+    [
+        pytest.param(get_wing_by_name_scoped, (1, 1), id="wing"),
+        pytest.param(get_floor_by_name_scoped, (1, 1, 1), id="floor"),
+        pytest.param(get_datacenter_by_name_scoped, (1, 1, 1, 1), id="datacenter"),
+        pytest.param(get_device_type_by_name_scoped, (1,), id="device_type"),
+        pytest.param(get_rack_by_name_scoped, (1, 1, 1, 1, 1), id="rack"),
+    ],
+)
+def test_get_by_name_scoped_not_found(make_chain_db, lookup, scope_ids):
+    # Chain length varies per lookup: query().filter()...first()
+    db = make_chain_db(None)
     
     with pytest.raises(HTTPException) as exc:
-        get_rack_by_name_scoped(db, "Missing", 1,1,1,1,1)
+        lookup(db, "Missing", *scope_ids)
     assert exc.value.status_code == 404
 
 
@@ -622,146 +537,81 @@ def test_get_rack_by_name_scoped_not_found():
 # Tests for create_rack Validations
 # ============================================================
 
+# Mock lookups to succeed
+@pytest.mark.usefixtures("patched_helpers")
 def test_create_rack_missing_height():
-    db = MagicMock()
+    db = MagicMock(spec=Session)
     data = {"name": "R1", "location_name": "L1", "building_name": "B1", "wing_name": "W1", "floor_name": "F1", "datacenter_name": "DC1"}
     
-    # Mock lookups to succeed
-    with patch("app.helpers.add_entity_helper.get_location_by_name"), \
-         patch("app.helpers.add_entity_helper.get_building_by_name"), \
-         patch("app.helpers.add_entity_helper.get_wing_by_name_scoped"), \
-         patch("app.helpers.add_entity_helper.get_floor_by_name_scoped"), \
-         patch("app.helpers.add_entity_helper.get_datacenter_by_name_scoped"), \
-         patch("app.helpers.add_entity_helper.db_operation"):
-         
-         with pytest.raises(HTTPException) as exc:
-             create_rack(db, data)
-         assert exc.value.status_code == 400
-         assert "Height is required" in exc.value.detail
+    with pytest.raises(HTTPException, match="Height is required") as exc:
+        create_rack(db, data)
+    assert exc.value.status_code == 400
 
 
 # ============================================================
 # Tests for create_device Validations
 # ============================================================
 
-class TestCreateDeviceValidations:
-    
-    @pytest.fixture
-    def mock_deps(self):
-        """Setup common mocks for create_device."""
-        mocks = {}
-        patcher_loc = patch("app.helpers.add_entity_helper.get_location_by_name")
-        patcher_bld = patch("app.helpers.add_entity_helper.get_building_by_name")
-        patcher_wing = patch("app.helpers.add_entity_helper.get_wing_by_name_scoped")
-        patcher_floor = patch("app.helpers.add_entity_helper.get_floor_by_name_scoped")
-        patcher_dc = patch("app.helpers.add_entity_helper.get_datacenter_by_name_scoped")
-        patcher_rack = patch("app.helpers.add_entity_helper.get_rack_by_name_scoped")
-        patcher_make = patch("app.helpers.add_entity_helper.get_make_by_name")
-        patcher_dt = patch("app.helpers.add_entity_helper.get_device_type_by_name_scoped")
-        patcher_model = patch("app.helpers.add_entity_helper.get_model_by_name")
-        patcher_ao = patch("app.helpers.add_entity_helper.get_asset_owner_by_name")
-        patcher_app = patch("app.helpers.add_entity_helper.get_application_by_name")
-        patcher_op = patch("app.helpers.add_entity_helper.db_operation")
-        
-        mocks["loc"] = patcher_loc.start()
-        mocks["bld"] = patcher_bld.start()
-        mocks["wing"] = patcher_wing.start()
-        mocks["floor"] = patcher_floor.start()
-        mocks["dc"] = patcher_dc.start()
-        mocks["rack"] = patcher_rack.start()
-        mocks["make"] = patcher_make.start()
-        mocks["dt"] = patcher_dt.start()
-        mocks["model"] = patcher_model.start()
-        mocks["ao"] = patcher_ao.start()
-        mocks["app"] = patcher_app.start()
-        patcher_op.start()
-        
-        yield mocks
-        
-        patcher_loc.stop()
-        patcher_bld.stop()
-        patcher_wing.stop()
-        patcher_floor.stop()
-        patcher_dc.stop()
-        patcher_rack.stop()
-        patcher_make.stop()
-        patcher_dt.stop()
-        patcher_model.stop()
-        patcher_ao.stop()
-        patcher_app.stop()
-        patcher_op.stop()
-
-    def test_incompatible_make(self, mock_deps):
-        db = MagicMock()
-        data = {
-            "location_name": "L1", "building_name": "B1", "wing_name": "W1", "floor_name": "F1", 
-            "datacenter_name": "DC1", "rack_name": "R1", "make_name": "M1", 
-            "devicetype_name": "DT1", "model_name": "Mod1", "asset_owner_name": "AO1", "application_name": "App1"
-        }
-        
-        mock_deps["make"].return_value.id = 1
-        mock_deps["model"].return_value.make_id = 2 # Mismatch
-        
-        with pytest.raises(HTTPException) as exc:
-            create_device(db, data)
-        assert exc.value.status_code == 400
-        assert "belongs to a different make" in exc.value.detail
+_VALIDATION_DEVICE_DATA = MappingProxyType({
+    "location_name": "L1", "building_name": "B1", "wing_name": "W1", "floor_name": "F1",
+    "datacenter_name": "DC1", "rack_name": "R1", "make_name": "M1",
+    "devicetype_name": "DT1", "model_name": "Mod1", "asset_owner_name": "AO1", "application_name": "App1",
+})
 
-    def test_incompatible_device_type(self, mock_deps):
-        db = MagicMock()
-        data = {
-            "location_name": "L1", "building_name": "B1", "wing_name": "W1", "floor_name": "F1", 
-            "datacenter_name": "DC1", "rack_name": "R1", "make_name": "M1", 
-            "devicetype_name": "DT1", "model_name": "Mod1", "asset_owner_name": "AO1", "application_name": "App1"
-        }
-        
-        mock_deps["make"].return_value.id = 1
-        mock_deps["model"].return_value.make_id = 1
-        mock_deps["dt"].return_value.id = 10
-        mock_deps["model"].return_value.device_type_id = 11 # Mismatch
-        
-        with pytest.raises(HTTPException) as exc:
-            create_device(db, data)
-        assert exc.value.status_code == 400
-        assert "not linked to device type" in exc.value.detail
 
-    def test_invalid_date_range(self, mock_deps):
-        db = MagicMock()
-        data = {
-            "location_name": "L1", "building_name": "B1", "wing_name": "W1", "floor_name": "F1", 
-            "datacenter_name": "DC1", "rack_name": "R1", "make_name": "M1", 
-            "devicetype_name": "DT1", "model_name": "Mod1", "asset_owner_name": "AO1", "application_name": "App1",
-            "warranty_start_date": date(2023, 1, 10),
-            "warranty_end_date": date(2023, 1, 1), # End before Start
-        }
-        
-        # Valid makes/models
-        mock_deps["make"].return_value.id = 1
-        mock_deps["model"].return_value.make_id = 1
-        mock_deps["dt"].return_value.id = 10
-        mock_deps["model"].return_value.device_type_id = 10
-        
-        with pytest.raises(HTTPException) as exc:
-            create_device(db, data)
-        assert exc.value.status_code == 400
-        assert "Warranty end date cannot be before start date" in exc.value.detail
+# Parametrize values are shared by every run of a case, so keep them read-only
+_NO_OVERRIDES = MappingProxyType({})
 
-    def test_missing_position(self, mock_deps):
-        db = MagicMock()
-        data = {
-            "location_name": "L1", "building_name": "B1", "wing_name": "W1", "floor_name": "F1", 
-            "datacenter_name": "DC1", "rack_name": "R1", "make_name": "M1", 
-            "devicetype_name": "DT1", "model_name": "Mod1", "asset_owner_name": "AO1", "application_name": "App1",
-            # No position
-        }
+# (lookup, attribute, value) settings under which make, model and device type agree
+_MATCHED_LOOKUPS = (
+    ("get_make_by_name", "id", 1),
+    ("get_model_by_name", "make_id", 1),
+    ("get_device_type_by_name_scoped", "id", 10),
+    ("get_model_by_name", "device_type_id", 10),
+)
+
+
+class TestCreateDeviceValidations:
+
+    @pytest.mark.parametrize(
+        "lookup_attrs, data_overrides, expected_detail",
+        [
+            pytest.param(
+                (("get_make_by_name", "id", 1), ("get_model_by_name", "make_id", 2)),
+                _NO_OVERRIDES,
+                "belongs to a different make",
+                id="incompatible_make",
+            ),
+            pytest.param(
+                _MATCHED_LOOKUPS[:3] + (("get_model_by_name", "device_type_id", 11),),
+                _NO_OVERRIDES,
+                "not linked to device type",
+                id="incompatible_device_type",
+            ),
+            pytest.param(
+                _MATCHED_LOOKUPS,
+                MappingProxyType({
+                    "warranty_start_date": date(2023, 1, 10),
+                    "warranty_end_date": date(2023, 1, 1), # End before Start
+                }),
+                "Warranty end date cannot be before start date",
+                id="invalid_date_range",
+            ),
+            pytest.param(
+                _MATCHED_LOOKUPS + (("get_model_by_name", "height", 2),),
+                _NO_OVERRIDES, # No position
+                "Position is required",
+                id="missing_position",
+            ),
+        ],
+    )
+    def test_create_device_rejects(self, patched_helpers, lookup_attrs, data_overrides, expected_detail):
+        db = MagicMock(spec=Session)
+        data = {**_VALIDATION_DEVICE_DATA, **data_overrides}
         
-        mock_deps["make"].return_value.id = 1
-        mock_deps["model"].return_value.make_id = 1
-        mock_deps["dt"].return_value.id = 10
-        mock_deps["model"].return_value.device_type_id = 10
-        mock_deps["model"].return_value.height = 2
+        for lookup, attr, value in lookup_attrs:
+            setattr(patched_helpers[lookup].return_value, attr, value)
         
-        with pytest.raises(HTTPException) as exc:
+        with pytest.raises(HTTPException, match=expected_detail) as exc:
             create_device(db, data)
         assert exc.value.status_code == 400
-        assert "Position is required" in exc.value.detail
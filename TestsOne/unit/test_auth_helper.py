@@ -1,11 +1,20 @@
-from datetime import datetime, timedelta, timezone
+import copy
+from datetime import datetime, timezone
 
-import jwt
 import pytest
 from fastapi import HTTPException, status
 
-from app.core.config import settings
-from app.helpers import auth_helper
+# Naive UTC expiries far enough from "now" that no clock read is needed;
+# every expiry-related test in this module derives its timestamps from these
+_FUTURE_EXPIRY = datetime(2999, 1, 1)
+_PAST_EXPIRY = datetime(2000, 1, 1)
+
+
+@pytest.fixture(scope="session")
+def auth_helper():
+    """Import app.helpers.auth_helper on first use rather than at collection."""
+    from app.helpers import auth_helper as module
+    return module
 
 
 class DummyRole:
@@ -36,7 +45,22 @@ class DummyUser:
         self.user_roles = roles or []
 
 
-def test_get_token_from_header_valid():
+_DEFAULT_USER = DummyUser()
+
+
+@pytest.fixture
+def make_user():
+    """Return a factory for copies of a default DummyUser with attributes overridden."""
+    def _make(**attrs):
+        user = copy.copy(_DEFAULT_USER)
+        user.user_roles = []  # never share the default's list
+        vars(user).update(attrs)
+        return user
+
+    return _make
+
+
+def test_get_token_from_header_valid(auth_helper):
     token = "abc123"
     header = f"Bearer {token}"
 
@@ -55,20 +79,20 @@ def test_get_token_from_header_valid():
         "bearer",  # missing token part
     ],
 )
-def test_get_token_from_header_invalid(header):
+def test_get_token_from_header_invalid(header, auth_helper):
     with pytest.raises(HTTPException) as exc_info:
         auth_helper._get_token_from_header(header)  # type: ignore[attr-defined]
 
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_build_jwt_payload_includes_roles_and_expiry():
+def test_build_jwt_payload_includes_roles_and_expiry(make_user, auth_helper):
     roles = [
         DummyUserRole(DummyRole("admin", is_active=True)),
         DummyUserRole(DummyRole("viewer", is_active=False)),  # inactive ignored
         DummyUserRole(DummyRole(None, is_active=True)),  # no code ignored
     ]
-    user = DummyUser(user_id=42, roles=roles)
+    user = make_user(id=42, user_roles=roles)
 
     payload = auth_helper._build_jwt_payload(user)  # type: ignore[attr-defined]
 
@@ -84,22 +108,32 @@ def test_build_jwt_payload_includes_roles_and_expiry():
     assert payload["exp"] > payload["iat"]
 
 
-def test_create_and_decode_access_token_roundtrip():
-    user = DummyUser(user_id=7)
+_TOKEN_USER = DummyUser(user_id=7)
+
+
+@pytest.fixture(scope="session")
+def valid_access_token(auth_helper):
+    """Encode one access token for _TOKEN_USER; tests that only decode it share it."""
+    return auth_helper.create_access_token_for_user(user=_TOKEN_USER)
 
-    token = auth_helper.create_access_token_for_user(user=user)
+
+def test_create_and_decode_access_token_roundtrip(valid_access_token, auth_helper):
+    token = valid_access_token
     assert isinstance(token, str) and token
 
     decoded = auth_helper.decode_access_token(token)
 
-    assert decoded["sub"] == str(7)
-    assert decoded["username"] == user.name
+    assert decoded["sub"] == str(_TOKEN_USER.id)
+    assert decoded["username"] == _TOKEN_USER.name
+
 
+def test_decode_access_token_expired_raises_419(auth_helper):
+    import jwt
+    from app.core.config import settings
 
-def test_decode_access_token_expired_raises_419():
     payload = {
         "sub": "1",
-        "exp": int((datetime.now(timezone.utc) - timedelta(seconds=1)).timestamp()),
+        "exp": int(_PAST_EXPIRY.replace(tzinfo=timezone.utc).timestamp()),
     }
     expired_token = jwt.encode(
         payload,
@@ -107,14 +141,16 @@ def test_decode_access_token_expired_raises_419():
         algorithm=settings.JWT_ALGORITHM,
     )
 
-    with pytest.raises(HTTPException) as exc_info:
+    with pytest.raises(HTTPException, match="(?i)expired") as exc_info:
         auth_helper.decode_access_token(expired_token)
 
     assert exc_info.value.status_code == 419
-    assert "expired" in exc_info.value.detail.lower()
 
 
-def test_decode_access_token_invalid_signature_raises_401():
+def test_decode_access_token_invalid_signature_raises_401(auth_helper):
+    import jwt
+    from app.core.config import settings
+
     # Token signed with a different key should be rejected
     bogus_token = jwt.encode(
         {"sub": "1"},
@@ -122,29 +158,28 @@ def test_decode_access_token_invalid_signature_raises_401():
         algorithm=settings.JWT_ALGORITHM,
     )
 
-    with pytest.raises(HTTPException) as exc_info:
+    with pytest.raises(HTTPException, match="(?i)invalid") as exc_info:
         auth_helper.decode_access_token(bogus_token)
 
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
-    assert "invalid" in exc_info.value.detail.lower()
 
 
 # ============================================================
 # NEW TEST: User with no roles should have empty roles list
 # ============================================================
-def test_build_jwt_payload_user_with_no_roles():
+def test_build_jwt_payload_user_with_no_roles(make_user, auth_helper):
     """
     Test that a user with no roles gets an empty roles list in JWT payload.
     
     This is an edge case - new users might not have roles assigned yet.
     """
     # STEP 1: Create a fake user with NO roles
-    user = DummyUser(
-        user_id=99,
+    user = make_user(
+        id=99,
         name="newuser",
         email="newuser@example.com",
         is_active=True,
-        roles=[],  # Empty roles!
+        user_roles=[],  # Empty roles!
     )
     
     # STEP 2: Call the function we're testing
@@ -158,17 +193,17 @@ def test_build_jwt_payload_user_with_no_roles():
     assert payload["is_active"] is True
 
 
-def test_build_jwt_payload_inactive_user():
+def test_build_jwt_payload_inactive_user(make_user, auth_helper):
     """
     Test that inactive user flag is correctly set in JWT payload.
     """
     # Create an INACTIVE user
-    user = DummyUser(
-        user_id=100,
+    user = make_user(
+        id=100,
         name="inactiveuser",
         email="inactive@example.com",
         is_active=False,  # Inactive!
-        roles=[],
+        user_roles=[],
     )
     
     payload = auth_helper._build_jwt_payload(user)
@@ -179,20 +214,29 @@ def test_build_jwt_payload_inactive_user():
 
 from unittest.mock import MagicMock, patch, ANY
 
-def test_get_current_refresh_token_success():
+def _set_query_result(db, result, path=("filter", "first")):
+    """Make db.query(...).<path>() return result, walking the mock chain once."""
+    node = db.query.return_value
+    for name in path[:-1]:
+        node = getattr(node, name).return_value
+    getattr(node, path[-1]).return_value = result
+
+
+def test_get_current_refresh_token_success(db, auth_helper):
     """Positive: Successfully retrieves and validates a refresh token."""
-    db = MagicMock()
     token_str = "refresh123"
     auth_header = f"Bearer {token_str}"
     
     mock_token_model = MagicMock()
     mock_token_model.token_key = token_str
     mock_token_model.token_type = "refresh"
-    mock_token_model.expires = datetime.utcnow() + timedelta(hours=1)
+    mock_token_model.expires = _FUTURE_EXPIRY
     
     # Mock database query
-    db.query.return_value.filter.return_value.first.return_value = mock_token_model
+    _set_query_result(db, mock_token_model)
     
+    # _get_models only needs a stand-in namespace; don't autospec it (or the
+    # other auth_helper patches below), it adds signature introspection per test.
     with patch("app.helpers.auth_helper._get_models") as mock_get_models:
         mock_models = MagicMock()
         mock_models.Token = MagicMock()
@@ -201,45 +245,40 @@ def test_get_current_refresh_token_success():
         result = auth_helper.get_current_refresh_token(db, auth_header)
         assert result == mock_token_model
 
-def test_get_current_refresh_token_not_found():
+def test_get_current_refresh_token_not_found(db, auth_helper):
     """Negative: 401 if refresh token not found in DB."""
-    db = MagicMock()
     auth_header = "Bearer unknown"
-    db.query.return_value.filter.return_value.first.return_value = None
+    _set_query_result(db, None)
     
     with patch("app.helpers.auth_helper._get_models"):
-        with pytest.raises(HTTPException) as exc:
+        with pytest.raises(HTTPException, match="not found") as exc:
             auth_helper.get_current_refresh_token(db, auth_header)
         assert exc.value.status_code == 401
-        assert "not found" in exc.value.detail
 
-def test_get_current_refresh_token_expired():
+def test_get_current_refresh_token_expired(db, auth_helper):
     """Negative: 401 if refresh token is expired."""
-    db = MagicMock()
     auth_header = "Bearer expired"
     
     mock_token = MagicMock()
     mock_token.token_type = "refresh"
-    mock_token.expires = datetime.utcnow() - timedelta(seconds=1)
+    mock_token.expires = _PAST_EXPIRY
     
-    db.query.return_value.filter.return_value.first.return_value = mock_token
+    _set_query_result(db, mock_token)
     
     with patch("app.helpers.auth_helper._get_models"):
-        with pytest.raises(HTTPException) as exc:
+        with pytest.raises(HTTPException, match="expired") as exc:
             auth_helper.get_current_refresh_token(db, auth_header)
         assert exc.value.status_code == 401
-        assert "expired" in exc.value.detail
 
-def test_get_current_user_success():
+def test_get_current_user_success(db, auth_helper):
     """Positive: Successfully retrieves active user from access token."""
-    db = MagicMock()
     user_id = 99
     
     # Mock user in DB
     mock_user = MagicMock()
     mock_user.id = user_id
     mock_user.is_active = True
-    db.query.return_value.get.return_value = mock_user
+    _set_query_result(db, mock_user, path=("get",))
     
     # Mock payload decoding
     with patch("app.helpers.auth_helper.decode_access_token") as mock_decode, \
@@ -250,22 +289,19 @@ def test_get_current_user_success():
         result = auth_helper.get_current_user("Bearer valid_token", db)
         assert result == mock_user
 
-def test_get_current_user_invalid_sub():
+def test_get_current_user_invalid_sub(db, auth_helper):
     """Negative: 401 if sub is missing or invalid."""
-    db = MagicMock()
     with patch("app.helpers.auth_helper.decode_access_token") as mock_decode:
         mock_decode.return_value = {} # Missing sub
         
-        with pytest.raises(HTTPException) as exc:
+        with pytest.raises(HTTPException, match="missing subject") as exc:
             auth_helper.get_current_user("Bearer token", db)
         assert exc.value.status_code == 401
-        assert "missing subject" in exc.value.detail
 
-def test_get_current_user_not_found_or_inactive():
+def test_get_current_user_not_found_or_inactive(db, auth_helper):
     """Negative: 401 if user doesn't exist or is inactive."""
-    db = MagicMock()
     # Case 1: User not found
-    db.query.return_value.get.return_value = None
+    _set_query_result(db, None, path=("get",))
     
     with patch("app.helpers.auth_helper.decode_access_token") as mock_decode, \
          patch("app.helpers.auth_helper._get_models"):
@@ -276,9 +312,8 @@ def test_get_current_user_not_found_or_inactive():
             auth_helper.get_current_user("Bearer token", db)
         assert exc.value.status_code == 401
 
-def test_build_menu_for_user_admin():
+def test_build_menu_for_user_admin(db, auth_helper):
     """Positive: Admin user gets all menus."""
-    db = MagicMock()
     user_id = 1
     
     # Mock user with admin role
@@ -289,7 +324,7 @@ def test_build_menu_for_user_admin():
     mock_user_role.role = mock_role
     mock_user.user_roles = [mock_user_role]
     
-    db.query.return_value.get.return_value = mock_user
+    _set_query_result(db, mock_user, path=("get",))
     
     # Mock menu query results
     mock_menu = MagicMock()
@@ -303,9 +338,11 @@ def test_build_menu_for_user_admin():
     mock_submenu.icon = "dash_icon"
     
     # Return list of (Menu, SubMenu) tuples
-    db.query.return_value.join.return_value.filter.return_value.filter.return_value.order_by.return_value.all.return_value = [
-        (mock_menu, mock_submenu)
-    ]
+    _set_query_result(
+        db,
+        [(mock_menu, mock_submenu)],
+        path=("join", "filter", "filter", "order_by", "all"),
+    )
     
     with patch("app.helpers.auth_helper._get_models"):
         result = auth_helper.build_menu_for_user(db, user_id)
@@ -315,10 +352,9 @@ def test_build_menu_for_user_admin():
         assert menu_list[0]["MenuHeaderName"] == "AdminMenu"
         assert menu_list[0]["sub_menu_details"][0]["display_name"] == "Dashboard"
 
-def test_create_token_pair_for_user():
+def test_create_token_pair_for_user(db, make_user, auth_helper):
     """Positive: Creates both access and refresh tokens."""
-    db = MagicMock()
-    user = DummyUser(user_id=5)
+    user = make_user(id=5)
     
     with patch("app.helpers.auth_helper.create_access_token_for_user") as mock_create_access, \
          patch("app.helpers.auth_helper.create_token_for_user") as mock_create_refresh:
@@ -15,36 +15,54 @@ from app.models.auth_models import (
 
 class TestAuthModels:
     
-    def test_user_instantiation(self):
-        """Positive: Verifies User instantiation and defaults."""
-        user = User(
-            name="jdoe", 
-            email="jdoe@example.com", 
-            full_name="John Doe"
-        )
-        assert user.name == "jdoe"
-        assert user.email == "jdoe@example.com"
-        assert user.is_active is None # Default applied by DB, but instance attr is None until flush usually
-        # Actually in SQLAlchemy usage, defaults defined on Column are applied at DB level or Python level depending on arg.
-        # Here we just verify mapped attributes.
-        assert user.__tablename__ == "dcim_user"
-
-    def test_token_model(self):
-        """Positive: Verifies Token model structure."""
-        token = Token(
-            token_key="abc-123",
-            user_id=1,
-            token_type="access"
-        )
-        assert token.token_key == "abc-123"
-        assert token.token_type == "access"
-        assert token.__tablename__ == "dcim_user_token"
+    @pytest.mark.parametrize(
+        "model, kwargs, tablename",
+        [
+            pytest.param(
+                User,
+                {"name": "jdoe", "email": "jdoe@example.com", "full_name": "John Doe"},
+                "dcim_user",
+                id="user",
+            ),
+            pytest.param(
+                Token,
+                {"token_key": "abc-123", "user_id": 1, "token_type": "access"},
+                "dcim_user_token",
+                id="token",
+            ),
+            pytest.param(Role, {"name": "Admin", "code": "ADMIN"}, "dcim_rbac_role", id="role"),
+            pytest.param(
+                AuditLog,
+                {"action": "create", "type": "device", "object_id": 100},
+                "dcim_audit_log",
+                id="audit_log",
+            ),
+            pytest.param(
+                UserLocationAccess, {"user_id": 1, "location_id": 5}, None,
+                id="user_location_access",
+            ),
+            pytest.param(
+                Environment,
+                {"name": "Production", "env_code": "PROD"},
+                "dcim_environment",
+                id="environment",
+            ),
+        ],
+    )
+    def test_model_instantiation(self, model, kwargs, tablename):
+        """Positive: Verifies mapped attributes are set from kwargs and the table name."""
+        instance = model(**kwargs)
+        for attr, value in kwargs.items():
+            assert getattr(instance, attr) == value
+        if tablename is not None:
+            assert instance.__tablename__ == tablename
 
-    def test_role_model(self):
-        """Positive: Verifies Role model."""
-        role = Role(name="Admin", code="ADMIN")
-        assert role.code == "ADMIN"
-        assert role.__tablename__ == "dcim_rbac_role"
+    def test_user_is_active_unset_until_flush(self):
+        """Positive: User.is_active stays None on the instance until the DB default applies."""
+        # Defaults defined on Column are applied at DB level or Python level depending on arg.
+        # Here we just verify mapped attributes.
+        user = User(name="jdoe", email="jdoe@example.com", full_name="John Doe")
+        assert user.is_active is None
 
     def test_menu_structure(self):
         """Positive: Verifies Menu and SubMenu relationship logic (attributes)."""
@@ -58,25 +76,6 @@ class TestAuthModels:
         # Unit testing raw objects:
         assert menu.header_name == "Dashboard"
         
-    def test_audit_log_model(self):
-        """Positive: Verifies AuditLog model."""
-        log = AuditLog(action="create", type="device", object_id=100)
-        assert log.action == "create"
-        assert log.__tablename__ == "dcim_audit_log"
-
-    def test_user_location_access(self):
-        """Positive: Verifies UserLocationAccess model."""
-        access = UserLocationAccess(user_id=1, location_id=5)
-        assert access.user_id == 1
-        assert access.location_id == 5
-
-    def test_environment_model(self):
-        """Positive: Verifies Environment model."""
-        env = Environment(name="Production", env_code="PROD")
-        assert env.name == "Production"
-        assert env.env_code == "PROD"
-        assert env.__tablename__ == "dcim_environment"
-
     def test_model_defaults_check(self):
         """Positive: check defaults existence on columns (metadata)."""
         # Testing metadata for defaults
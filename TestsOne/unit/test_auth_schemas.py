@@ -1,7 +1,11 @@
 
+import functools
+from dataclasses import dataclass
+from types import MappingProxyType
+
 import pytest
 from pydantic import ValidationError
-from typing import get_type_hints
+from typing import get_args, get_type_hints
 from app.schemas.auth_schemas import (
     LoginRequest,
     UserCreate,
@@ -23,411 +27,197 @@ from app.schemas.auth_schemas import (
 # Helpers
 # =============================================================================
 
+# Over-limit strings for the invalid-value tables, built once at import
+_STR_65 = "x" * 65
+_STR_256 = "x" * 256
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fields(schema_class):
+    """Field names of a schema class; fixed once the class is defined."""
+    return frozenset(schema_class.model_fields)
+
+
 def check_field_coverage(schema_class, tested_fields):
     """
     Ensures that all fields in the schema are present in the tested_fields list.
     """
-    model_fields = set(schema_class.model_fields.keys())
-    assert model_fields == set(tested_fields), \
+    model_fields = _schema_fields(schema_class)
+    assert model_fields == frozenset(tested_fields), \
         f"Mismatch in tested fields for {schema_class.__name__}. Missing: {model_fields - set(tested_fields)}"
 
-# =============================================================================
-# LoginRequest Tests
-# =============================================================================
 
-class TestLoginRequest:
-    @pytest.fixture
-    def valid_data(self):
-        return {
-            "username": "testuser",
-            "password": "secretpassword"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = LoginRequest(**valid_data)
-        assert model.username == valid_data["username"]
-        assert model.password == valid_data["password"]
-
-    @pytest.mark.parametrize("field, invalid_value, error_type", [
-        ("username", None, "string_type"), # Should be str
-        ("username", 123, "string_type"),
-        ("password", None, "string_type"),
-        ("password", 123, "string_type"),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value, error_type):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            LoginRequest(**data)
-        errors = exc_info.value.errors()
-        assert any(e["loc"] == (field,) for e in errors)
-
-    @pytest.mark.parametrize("field", ["username", "password"])
-    def test_missing_fields(self, valid_data, field):
-        data = valid_data.copy()
-        del data[field]
-        with pytest.raises(ValidationError) as exc_info:
-            LoginRequest(**data)
-        assert exc_info.value.errors()[0]["type"] == "missing"
-        assert exc_info.value.errors()[0]["loc"] == (field,)
+def assert_error_at(exc_info, field):
+    """Assert the ValidationError in exc_info reports an error located at field."""
+    errors = exc_info.value.errors(include_url=False, include_context=False)
+    assert (field,) in {e["loc"] for e in errors}, errors
+
 
-    def test_field_coverage(self):
-        check_field_coverage(LoginRequest, ["username", "password"])
+def _str_max_length(field_info):
+    """max_length of a plain-str field (Optional/Annotated unwrapped), else None.
+
+    Other string types such as EmailStr are skipped: a run of "x" is not a valid
+    value for them even within the length limit.
+    """
+    annotation = field_info.annotation
+    args = get_args(annotation)
+    if type(None) in args:
+        annotation = next(arg for arg in args if arg is not type(None))
+    constraints = [*field_info.metadata, *getattr(annotation, "__metadata__", ())]
+    if getattr(annotation, "__origin__", annotation) is not str:
+        return None
+    for constraint in constraints:
+        if getattr(constraint, "max_length", None) is not None:
+            return constraint.max_length
+    return None
 
 
 # =============================================================================
-# UserCreate Tests
+# Schema specs
 # =============================================================================
 
-class TestUserCreate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+@dataclass(frozen=True)
+class SchemaSpec:
+    """One auth schema and the cases the generated tests below run against it.
+
+    valid must set every field of the schema (test_field_coverage checks this),
+    required lists the fields whose absence is a validation error, and invalid
+    holds (field, value) pairs that must be rejected. max_lens pins the
+    max_length of every length-limited str field; test_declared_max_lengths
+    checks it against the schema and test_bva_fields probes each boundary.
+    """
+    model: type
+    valid: MappingProxyType
+    required: tuple = ()
+    invalid: tuple = ()
+    max_lens: MappingProxyType = MappingProxyType({})
+
+
+SCHEMA_SPECS = [
+    SchemaSpec(
+        LoginRequest,
+        MappingProxyType({
+            "username": "testuser",
+            "password": "secretpassword"
+        }),
+        required=("username", "password"),
+        invalid=(
+            ("username", None), # Should be str
+            ("username", 123),
+            ("password", None),
+            ("password", 123),
+        ),
+    ),
+    SchemaSpec(
+        UserCreate,
+        MappingProxyType({
             "name": "jdoe",
             "email": "jdoe@example.com",
             "full_name": "John Doe",
             "description": "A new user"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = UserCreate(**valid_data)
-        assert model.name == valid_data["name"]
-        assert model.email == valid_data["email"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("name", None),
-        ("name", 123),
-        ("email", "not-an-email"),
-        ("email", None),
-        ("description", "x" * 256),  # Max length 255
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    @pytest.mark.parametrize("field", ["name", "email"])
-    def test_missing_fields(self, valid_data, field):
-        data = valid_data.copy()
-        del data[field]
-        with pytest.raises(ValidationError) as exc_info:
-            UserCreate(**data)
-        assert exc_info.value.errors()[0]["type"] == "missing"
-
-    def test_field_coverage(self):
-        # UserCreate inherits from UserBase
-        check_field_coverage(UserCreate, ["name", "email", "full_name", "description"])
-
-    @pytest.mark.parametrize("length, should_pass", [
-        (255, True),  # Exact Boundary
-        (256, False), # Boundary + 1
-    ])
-    def test_bva_description(self, valid_data, length, should_pass):
-        data = valid_data.copy()
-        data["description"] = "x" * length
-        if should_pass:
-            model = UserCreate(**data)
-            assert len(model.description) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                UserCreate(**data)
-            assert any(e["loc"] == ("description",) for e in exc_info.value.errors())
-
-# =============================================================================
-# UserUpdate Tests
-# =============================================================================
-
-class TestUserUpdate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        required=("name", "email"),
+        invalid=(
+            ("name", None),
+            ("name", 123),
+            ("email", "not-an-email"),
+            ("email", None),
+            ("description", _STR_256),  # Max length 255
+        ),
+        max_lens=MappingProxyType({"description": 255}),
+    ),
+    SchemaSpec(
+        UserUpdate,
+        MappingProxyType({
             "name": "jdoe_updated",
             "email": "jdoe_updated@example.com",
             "full_name": "John Doe Updated",
             "is_active": False,
             "description": "Updated info"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = UserUpdate(**valid_data)
-        assert model.name == valid_data["name"]
-
-    def test_partial_update(self):
-        # All fields are optional
-        model = UserUpdate(name="only_name")
-        assert model.name == "only_name"
-        assert model.email is None
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("email", "not-an-email"),
-        ("description", "x" * 256),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            UserUpdate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    def test_field_coverage(self):
-        check_field_coverage(UserUpdate, ["name", "email", "full_name", "is_active", "description"])
-
-    @pytest.mark.parametrize("length, should_pass", [
-        (255, True),
-        (256, False),
-    ])
-    def test_bva_description(self, valid_data, length, should_pass):
-        data = valid_data.copy()
-        data["description"] = "x" * length
-        if should_pass:
-            model = UserUpdate(**data)
-            assert len(model.description) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                UserUpdate(**data)
-            assert any(e["loc"] == ("description",) for e in exc_info.value.errors())
-
-
-# =============================================================================
-# RoleCreate Tests
-# =============================================================================
-
-class TestRoleCreate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        invalid=(
+            ("email", "not-an-email"),
+            ("description", _STR_256),
+        ),
+        max_lens=MappingProxyType({"description": 255}),
+    ),
+    SchemaSpec(
+        RoleCreate,
+        MappingProxyType({
             "name": "Admin",
             "code": "admin_role_01",
             "is_active": True,
             "description": "Administrator Role"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = RoleCreate(**valid_data)
-        assert model.name == valid_data["name"]
-        assert model.code == valid_data["code"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("name", "x" * 256),
-        ("name", None),
-        ("code", "x" * 256),
-        ("code", None),
-        ("description", "x" * 256),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            RoleCreate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    @pytest.mark.parametrize("field", ["name", "code"])
-    def test_missing_fields(self, valid_data, field):
-        data = valid_data.copy()
-        del data[field]
-        with pytest.raises(ValidationError) as exc_info:
-            RoleCreate(**data)
-        assert exc_info.value.errors()[0]["type"] == "missing"
-
-    def test_field_coverage(self):
-        check_field_coverage(RoleCreate, ["name", "code", "is_active", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("name", 255, True), ("name", 256, False),
-        ("code", 255, True), ("code", 256, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = RoleCreate(**data)
-            assert len(getattr(model, field)) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                RoleCreate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-# =============================================================================
-# RoleUpdate Tests
-# =============================================================================
-
-class TestRoleUpdate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        required=("name", "code"),
+        invalid=(
+            ("name", _STR_256),
+            ("name", None),
+            ("code", _STR_256),
+            ("code", None),
+            ("description", _STR_256),
+        ),
+        max_lens=MappingProxyType({"name": 255, "code": 255, "description": 255}),
+    ),
+    SchemaSpec(
+        RoleUpdate,
+        MappingProxyType({
             "name": "Admin Updated",
             "code": "admin_updated",
             "is_active": False,
             "description": "Updated Role"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = RoleUpdate(**valid_data)
-        assert model.name == valid_data["name"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("name", "x" * 256),
-        ("code", "x" * 256),
-        ("description", "x" * 256),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            RoleUpdate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    def test_field_coverage(self):
-        check_field_coverage(RoleUpdate, ["name", "code", "is_active", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("name", 255, True), ("name", 256, False),
-        ("code", 255, True), ("code", 256, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = RoleUpdate(**data)
-            assert len(getattr(model, field)) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                RoleUpdate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-
-# =============================================================================
-# MenuCreate Tests
-# =============================================================================
-
-class TestMenuCreate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        invalid=(
+            ("name", _STR_256),
+            ("code", _STR_256),
+            ("description", _STR_256),
+        ),
+        max_lens=MappingProxyType({"name": 255, "code": 255, "description": 255}),
+    ),
+    SchemaSpec(
+        MenuCreate,
+        MappingProxyType({
             "header_name": "Dashboard",
             "code": "dashboard_menu",
             "icon": "fa-home",
             "sort_order": 1,
             "is_active": True,
             "description": "Main dashboard"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = MenuCreate(**valid_data)
-        assert model.header_name == valid_data["header_name"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("header_name", "x" * 256),
-        ("header_name", None),
-        ("code", "x" * 256),
-        ("code", None),
-        ("icon", "x" * 256),
-        ("description", "x" * 256),
-        ("sort_order", "not-an-int"),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            MenuCreate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    @pytest.mark.parametrize("field", ["header_name", "code"])
-    def test_missing_fields(self, valid_data, field):
-        data = valid_data.copy()
-        del data[field]
-        with pytest.raises(ValidationError) as exc_info:
-            MenuCreate(**data)
-        assert exc_info.value.errors()[0]["type"] == "missing"
-
-    def test_field_coverage(self):
-        check_field_coverage(MenuCreate, ["header_name", "code", "icon", "sort_order", "is_active", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("header_name", 255, True), ("header_name", 256, False),
-        ("code", 255, True), ("code", 256, False),
-        ("icon", 255, True), ("icon", 256, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = MenuCreate(**data)
-            val = getattr(model, field)
-            assert len(val) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                MenuCreate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-# =============================================================================
-# MenuUpdate Tests
-# =============================================================================
-
-class TestMenuUpdate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        required=("header_name", "code"),
+        invalid=(
+            ("header_name", _STR_256),
+            ("header_name", None),
+            ("code", _STR_256),
+            ("code", None),
+            ("icon", _STR_256),
+            ("description", _STR_256),
+            ("sort_order", "not-an-int"),
+        ),
+        max_lens=MappingProxyType({"header_name": 255, "code": 255, "icon": 255, "description": 255}),
+    ),
+    SchemaSpec(
+        MenuUpdate,
+        MappingProxyType({
             "header_name": "Dashboard Updated",
             "code": "dashboard_updated",
             "icon": "fa-home-alt",
             "sort_order": 2,
             "is_active": False,
             "description": "Updated dashboard"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = MenuUpdate(**valid_data)
-        assert model.header_name == valid_data["header_name"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("header_name", "x" * 256),
-        ("code", "x" * 256),
-        ("icon", "x" * 256),
-        ("description", "x" * 256),
-        ("sort_order", "not-an-int"),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            MenuUpdate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    def test_field_coverage(self):
-        check_field_coverage(MenuUpdate, ["header_name", "code", "icon", "sort_order", "is_active", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("header_name", 255, True), ("header_name", 256, False),
-        ("code", 255, True), ("code", 256, False),
-        ("icon", 255, True), ("icon", 256, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = MenuUpdate(**data)
-            assert len(getattr(model, field)) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                MenuUpdate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-
-# =============================================================================
-# SubMenuCreate Tests
-# =============================================================================
-
-class TestSubMenuCreate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        invalid=(
+            ("header_name", _STR_256),
+            ("code", _STR_256),
+            ("icon", _STR_256),
+            ("description", _STR_256),
+            ("sort_order", "not-an-int"),
+        ),
+        max_lens=MappingProxyType({"header_name": 255, "code": 255, "icon": 255, "description": 255}),
+    ),
+    SchemaSpec(
+        SubMenuCreate,
+        MappingProxyType({
             "display_name": "Overview",
             "page_url": "/dashboard/overview",
             "code": "overview_sub_01",
@@ -436,70 +226,32 @@ class TestSubMenuCreate:
             "sort_order": 5,
             "is_active": True,
             "description": "Dashboard overview page"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = SubMenuCreate(**valid_data)
-        assert model.display_name == valid_data["display_name"]
-        assert model.menu_id == valid_data["menu_id"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("display_name", "x" * 256),
-        ("display_name", None),
-        ("page_url", "x" * 256),
-        ("page_url", None),
-        ("code", "x" * 256),
-        ("code", None),
-        ("menu_id", "not-an-int"),
-        ("menu_id", None),
-        ("icon", "x" * 256),
-        ("description", "x" * 256),
-        ("sort_order", "not-an-int"),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            SubMenuCreate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    @pytest.mark.parametrize("field", ["display_name", "page_url", "code", "menu_id"])
-    def test_missing_fields(self, valid_data, field):
-        data = valid_data.copy()
-        del data[field]
-        with pytest.raises(ValidationError) as exc_info:
-            SubMenuCreate(**data)
-        assert exc_info.value.errors()[0]["type"] == "missing"
-
-    def test_field_coverage(self):
-        check_field_coverage(SubMenuCreate, ["display_name", "page_url", "code", "menu_id", "icon", "sort_order", "is_active", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("display_name", 255, True), ("display_name", 256, False),
-        ("page_url", 255, True), ("page_url", 256, False),
-        ("code", 255, True), ("code", 256, False),
-        ("icon", 255, True), ("icon", 256, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = SubMenuCreate(**data)
-            assert len(getattr(model, field)) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                SubMenuCreate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-# =============================================================================
-# SubMenuUpdate Tests
-# =============================================================================
-
-class TestSubMenuUpdate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        required=("display_name", "page_url", "code", "menu_id"),
+        invalid=(
+            ("display_name", _STR_256),
+            ("display_name", None),
+            ("page_url", _STR_256),
+            ("page_url", None),
+            ("code", _STR_256),
+            ("code", None),
+            ("menu_id", "not-an-int"),
+            ("menu_id", None),
+            ("icon", _STR_256),
+            ("description", _STR_256),
+            ("sort_order", "not-an-int"),
+        ),
+        max_lens=MappingProxyType({
+            "display_name": 255,
+            "page_url": 255,
+            "code": 255,
+            "icon": 255,
+            "description": 255,
+        }),
+    ),
+    SchemaSpec(
+        SubMenuUpdate,
+        MappingProxyType({
             "display_name": "Overview Updated",
             "page_url": "/dashboard/overview-updated",
             "code": "overview_updated",
@@ -508,256 +260,180 @@ class TestSubMenuUpdate:
             "sort_order": 6,
             "is_active": False,
             "description": "Updated overview"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = SubMenuUpdate(**valid_data)
-        assert model.display_name == valid_data["display_name"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("display_name", "x" * 256),
-        ("page_url", "x" * 256),
-        ("code", "x" * 256),
-        ("menu_id", "not-an-int"),
-        ("icon", "x" * 256),
-        ("description", "x" * 256),
-        ("sort_order", "not-an-int"),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            SubMenuUpdate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    def test_field_coverage(self):
-        check_field_coverage(SubMenuUpdate, ["display_name", "page_url", "code", "menu_id", "icon", "sort_order", "is_active", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("display_name", 255, True), ("display_name", 256, False),
-        ("page_url", 255, True), ("page_url", 256, False),
-        ("code", 255, True), ("code", 256, False),
-        ("icon", 255, True), ("icon", 256, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = SubMenuUpdate(**data)
-            assert len(getattr(model, field)) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                SubMenuUpdate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-
-# =============================================================================
-# RoleSubMenuAccessCreate Tests
-# =============================================================================
-
-class TestRoleSubMenuAccessCreate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        invalid=(
+            ("display_name", _STR_256),
+            ("page_url", _STR_256),
+            ("code", _STR_256),
+            ("menu_id", "not-an-int"),
+            ("icon", _STR_256),
+            ("description", _STR_256),
+            ("sort_order", "not-an-int"),
+        ),
+        max_lens=MappingProxyType({
+            "display_name": 255,
+            "page_url": 255,
+            "code": 255,
+            "icon": 255,
+            "description": 255,
+        }),
+    ),
+    SchemaSpec(
+        RoleSubMenuAccessCreate,
+        MappingProxyType({
             "role_id": 1,
             "sub_menu_id": 2,
             "can_view": True,
             "description": "Access allowed"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = RoleSubMenuAccessCreate(**valid_data)
-        assert model.role_id == valid_data["role_id"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("role_id", "not-an-int"),
-        ("role_id", None),
-        ("sub_menu_id", "not-an-int"),
-        ("sub_menu_id", None),
-        ("description", "x" * 256),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            RoleSubMenuAccessCreate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    @pytest.mark.parametrize("field", ["role_id", "sub_menu_id"])
-    def test_missing_fields(self, valid_data, field):
-        data = valid_data.copy()
-        del data[field]
-        with pytest.raises(ValidationError) as exc_info:
-            RoleSubMenuAccessCreate(**data)
-        assert exc_info.value.errors()[0]["type"] == "missing"
-
-    def test_field_coverage(self):
-        check_field_coverage(RoleSubMenuAccessCreate, ["role_id", "sub_menu_id", "can_view", "description"])
-
-    @pytest.mark.parametrize("length, should_pass", [
-        (255, True),
-        (256, False),
-    ])
-    def test_bva_description(self, valid_data, length, should_pass):
-        data = valid_data.copy()
-        data["description"] = "x" * length
-        if should_pass:
-            model = RoleSubMenuAccessCreate(**data)
-            assert len(model.description) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                RoleSubMenuAccessCreate(**data)
-            assert any(e["loc"] == ("description",) for e in exc_info.value.errors())
-
-
-# =============================================================================
-# RoleSubMenuAccessUpdate Tests
-# =============================================================================
-
-class TestRoleSubMenuAccessUpdate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        required=("role_id", "sub_menu_id"),
+        invalid=(
+            ("role_id", "not-an-int"),
+            ("role_id", None),
+            ("sub_menu_id", "not-an-int"),
+            ("sub_menu_id", None),
+            ("description", _STR_256),
+        ),
+        max_lens=MappingProxyType({"description": 255}),
+    ),
+    SchemaSpec(
+        RoleSubMenuAccessUpdate,
+        MappingProxyType({
             "can_view": False,
             "description": "Access revoked"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = RoleSubMenuAccessUpdate(**valid_data)
-        assert model.can_view == valid_data["can_view"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("description", "x" * 256),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            RoleSubMenuAccessUpdate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    def test_field_coverage(self):
-        check_field_coverage(RoleSubMenuAccessUpdate, ["can_view", "description"])
-
-    @pytest.mark.parametrize("length, should_pass", [
-        (255, True),
-        (256, False),
-    ])
-    def test_bva_description(self, valid_data, length, should_pass):
-        data = valid_data.copy()
-        data["description"] = "x" * length
-        if should_pass:
-            model = RoleSubMenuAccessUpdate(**data)
-            assert len(model.description) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                RoleSubMenuAccessUpdate(**data)
-            assert any(e["loc"] == ("description",) for e in exc_info.value.errors())
-
-
-# =============================================================================
-# EnvironmentCreate Tests
-# =============================================================================
-
-class TestEnvironmentCreate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
+        }),
+        invalid=(("description", _STR_256),),
+        max_lens=MappingProxyType({"description": 255}),
+    ),
+    SchemaSpec(
+        EnvironmentCreate,
+        MappingProxyType({
             "name": "Production",
             "env_code": "PROD",
             "description": "Live environment"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = EnvironmentCreate(**valid_data)
-        assert model.name == valid_data["name"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("name", "x" * 256),
-        ("name", None),
-        ("env_code", "x" * 65), # Max 64
-        ("env_code", None),
-        ("description", "x" * 256),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
-        with pytest.raises(ValidationError) as exc_info:
-            EnvironmentCreate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
+        }),
+        required=("name", "env_code"),
+        invalid=(
+            ("name", _STR_256),
+            ("name", None),
+            ("env_code", _STR_65), # Max 64
+            ("env_code", None),
+            ("description", _STR_256),
+        ),
+        max_lens=MappingProxyType({"name": 255, "env_code": 64, "description": 255}),
+    ),
+    SchemaSpec(
+        EnvironmentUpdate,
+        MappingProxyType({
+            "name": "Production Updated",
+            "env_code": "PROD2",
+            "description": "Live environment updated"
+        }),
+        invalid=(
+            ("name", _STR_256),
+            ("env_code", _STR_65),
+            ("description", _STR_256),
+        ),
+        max_lens=MappingProxyType({"name": 255, "env_code": 64, "description": 255}),
+    ),
+]
+
+
+def _value_id(value):
+    """Short parametrize id for a probe value (long strings by length only)."""
+    if isinstance(value, str):
+        return f"len{len(value)}" if len(value) > 32 else value
+    return type(value).__name__.lower().replace("nonetype", "none")
+
+
+_SPEC_IDS = [spec.model.__name__ for spec in SCHEMA_SPECS]
+
+_REQUIRED_CASES = [
+    pytest.param(spec, field, id=f"{spec.model.__name__}-{field}")
+    for spec in SCHEMA_SPECS
+    for field in spec.required
+]
+
+_INVALID_CASES = [
+    pytest.param(spec, field, value, id=f"{spec.model.__name__}-{field}-{_value_id(value)}")
+    for spec in SCHEMA_SPECS
+    for field, value in spec.invalid
+]
+
+# Every pinned max_length, probed at the limit and one past it
+_BVA_CASES = [
+    pytest.param(spec, field, length, length <= max_len,
+                 id=f"{spec.model.__name__}-{field}-{length}")
+    for spec in SCHEMA_SPECS
+    for field, max_len in spec.max_lens.items()
+    for length in (max_len, max_len + 1)
+]
+
+# One boundary string per distinct probed length, shared by all BVA cases
+_STR_OF_LENGTH = {
+    length: "x" * length
+    for length in {case.values[2] for case in _BVA_CASES}
+}
 
-    @pytest.mark.parametrize("field", ["name", "env_code"])
-    def test_missing_fields(self, valid_data, field):
-        data = valid_data.copy()
-        del data[field]
-        with pytest.raises(ValidationError) as exc_info:
-            EnvironmentCreate(**data)
-        assert exc_info.value.errors()[0]["type"] == "missing"
-
-    def test_field_coverage(self):
-        check_field_coverage(EnvironmentCreate, ["name", "env_code", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("name", 255, True), ("name", 256, False),
-        ("env_code", 64, True), ("env_code", 65, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = EnvironmentCreate(**data)
-            assert len(getattr(model, field)) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                EnvironmentCreate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
 
 # =============================================================================
-# EnvironmentUpdate Tests
+# Generated tests
 # =============================================================================
 
-class TestEnvironmentUpdate:
-    @pytest.fixture
-    def valid_data(self):
-        return {
-            "name": "Production Updated",
-            "env_code": "PROD2",
-            "description": "Live environment updated"
-        }
-
-    def test_happy_path(self, valid_data):
-        model = EnvironmentUpdate(**valid_data)
-        assert model.name == valid_data["name"]
-
-    @pytest.mark.parametrize("field, invalid_value", [
-        ("name", "x" * 256),
-        ("env_code", "x" * 65),
-        ("description", "x" * 256),
-    ])
-    def test_invalid_values(self, valid_data, field, invalid_value):
-        data = valid_data.copy()
-        data[field] = invalid_value
+@pytest.mark.parametrize("spec", SCHEMA_SPECS, ids=_SPEC_IDS)
+def test_happy_path(spec):
+    model = spec.model(**spec.valid)
+    for field, value in spec.valid.items():
+        assert getattr(model, field) == value
+
+
+@pytest.mark.parametrize("spec", SCHEMA_SPECS, ids=_SPEC_IDS)
+def test_field_coverage(spec):
+    check_field_coverage(spec.model, spec.valid)
+
+
+@pytest.mark.parametrize("spec", SCHEMA_SPECS, ids=_SPEC_IDS)
+def test_declared_max_lengths(spec):
+    declared = {
+        field: max_len
+        for field, field_info in spec.model.model_fields.items()
+        if (max_len := _str_max_length(field_info)) is not None
+    }
+    assert declared == spec.max_lens
+
+
+@pytest.mark.parametrize("spec, field", _REQUIRED_CASES)
+def test_missing_required(spec, field):
+    data = {k: v for k, v in spec.valid.items() if k != field}
+    with pytest.raises(ValidationError) as exc_info:
+        spec.model(**data)
+    error = exc_info.value.errors(include_url=False, include_context=False)[0]
+    assert error["type"] == "missing"
+    assert error["loc"] == (field,)
+
+
+@pytest.mark.parametrize("spec, field, invalid_value", _INVALID_CASES)
+def test_invalid_values(spec, field, invalid_value):
+    data = spec.valid | {field: invalid_value}
+    with pytest.raises(ValidationError) as exc_info:
+        spec.model(**data)
+    assert_error_at(exc_info, field)
+
+
+@pytest.mark.parametrize("spec, field, length, should_pass", _BVA_CASES)
+def test_bva_fields(spec, field, length, should_pass):
+    data = spec.valid | {field: _STR_OF_LENGTH[length]}
+    if should_pass:
+        model = spec.model(**data)
+        assert len(getattr(model, field)) == length
+    else:
         with pytest.raises(ValidationError) as exc_info:
-            EnvironmentUpdate(**data)
-        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
-
-    def test_field_coverage(self):
-        check_field_coverage(EnvironmentUpdate, ["name", "env_code", "description"])
-
-    @pytest.mark.parametrize("field, length, should_pass", [
-        ("name", 255, True), ("name", 256, False),
-        ("env_code", 64, True), ("env_code", 65, False),
-        ("description", 255, True), ("description", 256, False),
-    ])
-    def test_bva_fields(self, valid_data, field, length, should_pass):
-        data = valid_data.copy()
-        data[field] = "x" * length
-        if should_pass:
-            model = EnvironmentUpdate(**data)
-            assert len(getattr(model, field)) == length
-        else:
-            with pytest.raises(ValidationError) as exc_info:
-                EnvironmentUpdate(**data)
-            assert any(e["loc"] == (field,) for e in exc_info.value.errors())
+            spec.model(**data)
+        assert_error_at(exc_info, field)
+
+
+def test_user_update_partial_update():
+    # All fields are optional
+    model = UserUpdate(name="only_name")
+    assert model.name == "only_name"
+    assert model.email is None
@@ -1,4 +1,3 @@
-import os
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
@@ -6,20 +5,68 @@ from pydantic import ValidationError
 from app.core import config
 from app.core.config import Settings, get_settings, load_environment, get_env_load_state
 
+# Patchers shared by the TestLoadEnvironment tests. patch.object holds the target
+# objects themselves, so no dotted path is re-imported each time one is applied.
+_LOAD_DOTENV_PATCH = patch.object(config, "load_dotenv")
+_PATH_EXISTS_PATCH = patch.object(config.Path, "exists")
+
+
+def _settings_env_names():
+    """Yield the env var names Settings() reads, one or more per field.
+
+    An alias (validation_alias first) replaces the name outright and ignores
+    env_prefix; AliasChoices contributes each plain-string choice.
+    """
+    prefix = Settings.model_config.get("env_prefix", "")
+    for name, field in Settings.model_fields.items():
+        alias = field.validation_alias or field.alias
+        if alias is None:
+            yield f"{prefix}{name}".upper()
+        else:
+            choices = alias.choices if hasattr(alias, "choices") else [alias]
+            yield from (choice.upper() for choice in choices if isinstance(choice, str))
+
+
+# Environment variables Settings() reads. Tests clear just these (plus APP_ENV,
+# which picks the env file) rather than snapshotting and emptying all of
+# os.environ with patch.dict(..., clear=True).
+_SETTINGS_ENV_VARS = ("APP_ENV", *_settings_env_names())
+
+
+@pytest.fixture
+def settings_env(monkeypatch):
+    """Return a setter: clear every Settings env var, then set APP_ENV if given."""
+    def _set(app_env=None):
+        for name in _SETTINGS_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+        if app_env is not None:
+            monkeypatch.setenv("APP_ENV", app_env)
+
+    return _set
+
+
+@pytest.fixture(autouse=True)
+def _reset_config_globals(monkeypatch):
+    """Start each test with no cached settings or env-load state.
+
+    monkeypatch restores the originals afterwards, so tests from other modules
+    that land on the same xdist worker still see an untouched config module.
+    """
+    monkeypatch.setattr(config, "_settings", None)
+    monkeypatch.setattr(config, "_loaded_env_file", None)
+    monkeypatch.setattr(config, "_env_load_warning", None)
+
+
 class TestLoadEnvironment:
     """Tests for load_environment function."""
 
-    @patch("app.core.config.load_dotenv")
-    @patch("app.core.config.Path.exists")
-    @patch.dict(os.environ, {"APP_ENV": "dev"}, clear=True)
-    def test_load_environment_dev(self, mock_exists, mock_load_dotenv):
+    @_LOAD_DOTENV_PATCH
+    @_PATH_EXISTS_PATCH
+    def test_load_environment_dev(self, mock_exists, mock_load_dotenv, settings_env):
         """Positive: Loads .env.dev for dev environment."""
+        settings_env("dev")
         mock_exists.return_value = True
         
-        # Reset globals
-        config._loaded_env_file = None
-        config._env_load_warning = None
-        
         load_environment()
         
         mock_load_dotenv.assert_called()
@@ -29,28 +76,24 @@ class TestLoadEnvironment:
         assert config._loaded_env_file is not None
         assert ".env.dev" in config._loaded_env_file
 
-    @patch("app.core.config.load_dotenv")
-    @patch("app.core.config.Path.exists")
-    @patch.dict(os.environ, {"APP_ENV": "test"}, clear=True)
-    def test_load_environment_test(self, mock_exists, mock_load_dotenv):
+    @_LOAD_DOTENV_PATCH
+    @_PATH_EXISTS_PATCH
+    def test_load_environment_test(self, mock_exists, mock_load_dotenv, settings_env):
         """Positive: Loads .env.test for test environment."""
+        settings_env("test")
         mock_exists.return_value = True
         
-        config._loaded_env_file = None
         load_environment()
         
         assert str(mock_load_dotenv.call_args[0][0]).endswith(".env.test")
 
-    @patch("app.core.config.load_dotenv")
-    @patch("app.core.config.Path.exists")
-    @patch.dict(os.environ, {"APP_ENV": "prod"}, clear=True)
-    def test_load_environment_missing_file(self, mock_exists, mock_load_dotenv):
+    @_LOAD_DOTENV_PATCH
+    @_PATH_EXISTS_PATCH
+    def test_load_environment_missing_file(self, mock_exists, mock_load_dotenv, settings_env):
         """Positive: Handles missing env file gracefully (sets warning)."""
+        settings_env("prod")
         mock_exists.return_value = False
         
-        config._loaded_env_file = None
-        config._env_load_warning = None
-        
         load_environment()
         
         mock_load_dotenv.assert_not_called()
@@ -61,18 +104,18 @@ class TestLoadEnvironment:
 class TestSettings:
     """Tests for Settings class initialization and logic."""
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_settings_defaults(self):
+    def test_settings_defaults(self, settings_env):
         """Positive: Verify default settings."""
+        settings_env()
         settings = Settings()
         assert settings.ENVIRONMENT == "dev"
         assert settings.LOG_LEVEL == "DEBUG"
         assert settings.JWT_ALGORITHM == "HS256"
         assert settings.ACCESS_TOKEN_EXPIRE_SECONDS == 900
 
-    @patch.dict(os.environ, {"APP_ENV": "prod"}, clear=True)
-    def test_settings_prod_log_level(self):
+    def test_settings_prod_log_level(self, settings_env):
         """Positive: LOG_LEVEL is INFO in prod environment."""
+        settings_env("prod")
         settings = Settings(ENVIRONMENT="prod")
         assert settings.ENVIRONMENT == "prod"
         assert settings.LOG_LEVEL == "INFO"
@@ -106,9 +149,6 @@ class TestGetSettingsAndProxy:
 
     def test_get_settings_singleton(self):
         """Positive: get_settings returns the same instance."""
-        # Reset global settings
-        config._settings = None
-        
         s1 = get_settings()
         s2 = get_settings()
         
@@ -117,9 +157,6 @@ class TestGetSettingsAndProxy:
 
     def test_settings_proxy_access(self):
         """Positive: Proxy delegates attribute access."""
-        # Reset global settings
-        config._settings = None
-        
         # Access through proxy
         assert config.settings.JWT_ALGORITHM == "HS256"
         
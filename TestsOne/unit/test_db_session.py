@@ -1,18 +1,29 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from app.db import session
 from app.db.session import get_db
 
-def test_get_db():
-    # Mock SessionLocal
-    mock_session = MagicMock()
-    with patch("app.db.session.SessionLocal", return_value=mock_session):
-        gen = get_db()
-        db = next(gen)
-        assert db == mock_session
-        
-        # Verify close is called
-        try:
-            next(gen)
-        except StopIteration:
-            pass
-        mock_session.close.assert_called_once()
+
+class _SessionStub:
+    """Stands in for a SessionLocal() session; get_db only ever calls close()."""
+
+    def __init__(self):
+        self.close_count = 0
+
+    def close(self):
+        self.close_count += 1
+
+
+def test_get_db(monkeypatch):
+    stub = _SessionStub()
+    monkeypatch.setattr(session, "SessionLocal", lambda: stub)
+
+    gen = get_db()
+    db = next(gen)
+    assert db is stub
+
+    # Verify close is called
+    try:
+        next(gen)
+    except StopIteration:
+        pass
+    assert stub.close_count == 1
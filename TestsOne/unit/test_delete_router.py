@@ -5,6 +5,11 @@ from sqlalchemy.exc import IntegrityError
 from app.dcim.routers.delete_router import delete_entity
 from app.helpers.listing_types import ListingType
 
+# Handler errors, built once; each is raised by a single test
+_INTEGRITY_ERR = IntegrityError("orig", "params", "orig")
+_GENERIC_ERR = Exception("Boom")
+_HTTP_404 = HTTPException(status_code=404, detail="Not Found")
+
 class TestDeleteRouter:
     
     # ENTITY_DELETE_HANDLERS is local import, so we patch _get_delete_handlers directly
@@ -57,7 +62,7 @@ class TestDeleteRouter:
     @patch("app.dcim.routers.delete_router._get_delete_handlers")
     def test_delete_entity_integrity_error(self, mock_get_handlers):
         """Negative: Database integrity error (Conflict)."""
-        mock_handler = MagicMock(side_effect=IntegrityError("orig", "params", "orig"))
+        mock_handler = MagicMock(side_effect=_INTEGRITY_ERR)
         mock_get_handlers.return_value = {ListingType.devices: mock_handler}
         
         db = MagicMock()
@@ -78,7 +83,7 @@ class TestDeleteRouter:
     @patch("app.dcim.routers.delete_router._get_delete_handlers")
     def test_delete_entity_generic_error(self, mock_get_handlers):
         """Negative: Generic internal error."""
-        mock_handler = MagicMock(side_effect=Exception("Boom"))
+        mock_handler = MagicMock(side_effect=_GENERIC_ERR)
         mock_get_handlers.return_value = {ListingType.devices: mock_handler}
         
         db = MagicMock()
@@ -99,7 +104,7 @@ class TestDeleteRouter:
     @patch("app.dcim.routers.delete_router._get_delete_handlers")
     def test_delete_entity_http_exception_propagation(self, mock_get_handlers):
         """Negative: Propagates HTTP exceptions from handler (e.g. 404)."""
-        mock_handler = MagicMock(side_effect=HTTPException(status_code=404, detail="Not Found"))
+        mock_handler = MagicMock(side_effect=_HTTP_404)
         mock_get_handlers.return_value = {ListingType.devices: mock_handler}
         
         db = MagicMock()